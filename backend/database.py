@@ -5,6 +5,7 @@ Supabase 연결 설정 및 데이터베이스 유틸리티
 """
 
 import os
+import asyncio
 from typing import Optional
 from functools import lru_cache
 from supabase import create_client, Client
@@ -66,7 +67,8 @@ class DatabaseHelper:
     
     async def get_project(self, project_id: str) -> dict:
         """프로젝트 조회"""
-        result = self.client.table("projects").select("*").eq("id", project_id).execute()
+        query = self.client.table("projects").select("*").eq("id", project_id)
+        result = await asyncio.to_thread(query.execute)
         return result.data[0] if result.data else None
     
     async def get_user_projects(self, user_id: str, limit: int = 50) -> list:
@@ -105,12 +107,12 @@ class DatabaseHelper:
     
     async def get_project_assets(self, project_id: str) -> list:
         """프로젝트 자산 목록"""
-        result = (
+        query = (
             self.client.table("assets")
             .select("*")
             .eq("project_id", project_id)
-            .execute()
         )
+        result = await asyncio.to_thread(query.execute)
         return result.data
     
     async def update_asset(self, asset_id: str, updates: dict) -> dict:
@@ -235,12 +237,17 @@ async def init_database():
     # 실제로는 Supabase 대시보드에서 SQL로 테이블 생성
     tables = ["projects", "assets", "vendors", "profiles", "user_actions"]
     
-    for table in tables:
-        try:
-            result = client.table(table).select("id").limit(1).execute()
+    # 테이블별 확인 쿼리는 독립적이므로 병렬 실행
+    results = await asyncio.gather(
+        *(asyncio.to_thread(client.table(table).select("id").limit(1).execute) for table in tables),
+        return_exceptions=True
+    )
+    
+    for table, result in zip(tables, results):
+        if isinstance(result, Exception):
+            print(f"❌ Table '{table}' check failed: {result}")
+        else:
             print(f"✅ Table '{table}' exists")
-        except Exception as e:
-            print(f"❌ Table '{table}' check failed: {e}")
     
     return True
 
@@ -14,13 +14,18 @@ Prompt Engineering:
 """
 
 import os
-import json
+import asyncio
+import re
+import orjson
+import hashlib
+import unicodedata
 import httpx
 from typing import Optional, Dict, Any, List, Tuple
 from enum import Enum
 from dataclasses import dataclass
 from datetime import datetime
 import google.generativeai as genai
+from cachetools import TTLCache
 
 # ============================================
 # Enums & Data Classes
@@ -74,6 +79,70 @@ class DirectorAnalysis:
     timestamp: str
 
 
+# ============================================
+# Gemini System Instructions
+# ============================================
+
+# 의도 분석용 고정 지시문 - 요청마다 바이트 단위로 동일해야 Gemini implicit cache가 prefix를 재사용
+ANALYSIS_SYSTEM_PROMPT = """당신은 영상 제작 AI Director입니다. 
+사용자의 요청을 분석하여 최적의 AI 툴을 결정해야 합니다.
+
+[사용 가능한 툴]
+1. VEO: 리얼리즘, 물리 법칙, 자동차, 스포츠, 액션
+2. KLING: 범용 영상, 일반적인 콘텐츠
+3. SORA: 시네마틱, 영화적 배경, 드라마틱
+4. MIDJOURNEY: 이미지 생성, 캐릭터 디자인
+5. HEYGEN: AI 아바타, 발표자, 뉴스 리포터
+6. SUNO: 음악, BGM, 효과음
+
+[응답 형식 - JSON만 출력]
+{
+  "primary_tool": "VEO|KLING|SORA|MIDJOURNEY|HEYGEN|SUNO",
+  "secondary_tool": "null 또는 툴명",
+  "intent": "realism_action|character_product|informational|cinematic|music_audio",
+  "confidence": 0.0-1.0,
+  "reasoning": "선택 이유 한 줄"
+}"""
+
+# 마크다운 코드 블록(```json ... ```) 안의 JSON 추출 - 닫는 fence가 없어도 허용
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*(?:```|$)", re.S)
+
+
+def strip_json_fence(text: str) -> str:
+    """Gemini 응답에서 코드 블록 fence 제거 (fence가 없으면 원문)"""
+    match = _JSON_FENCE_RE.search(text)
+    return match.group(1) if match else text.strip()
+
+
+# 이 크기 이상의 JSON은 스레드에서 파싱 (이벤트 루프 블로킹 방지)
+JSON_OFFLOAD_THRESHOLD = 64 * 1024
+
+
+async def loads_json(text: str) -> Any:
+    """JSON 파싱 - 큰 본문은 asyncio.to_thread로 이벤트 루프 밖에서 처리"""
+    if len(text) >= JSON_OFFLOAD_THRESHOLD:
+        return await asyncio.to_thread(orjson.loads, text)
+    return orjson.loads(text)
+
+
+# 동일 요청 문구의 분석 결과 재사용 (자주 쓰는 추천 문구 등)
+ANALYSIS_RESULT_CACHE_SIZE = 2048
+ANALYSIS_RESULT_CACHE_TTL = 600
+
+# 캐시 키 정규화 - 띄어쓰기/문장부호/존댓말 어미만 다른 문구는 같은 요청으로 취급
+# ("영상 만들어줘" / "영상 만들어 주세요!" → 같은 키)
+_CACHE_KEY_STRIP_RE = re.compile(r"[\s\W_]+")
+_CACHE_KEY_ENDING_RE = re.compile(r"(?:주세요|주십시오|주실래요|줄래요|줄래|줘요)$")
+
+
+def _analysis_cache_key(user_input: str) -> bytes:
+    """분석 결과 캐시 키 (정규화된 문구의 blake2b)"""
+    text = unicodedata.normalize("NFKC", user_input).lower()
+    text = _CACHE_KEY_STRIP_RE.sub("", text)
+    text = _CACHE_KEY_ENDING_RE.sub("줘", text)
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
 # ============================================
 # AI Director Engine
 # ============================================
@@ -149,25 +218,63 @@ class AIDirector:
         }
     }
     
+    # 스마트 라우팅 맵 - 의도별 최적 툴 선택 (primary, secondary, 판단 근거)
+    ROUTING_MAP = {
+        IntentCategory.REALISM_ACTION: (ToolType.VEO, None, "액션/리얼리즘 - Veo3.1 물리법칙 적용"),
+        IntentCategory.CHARACTER_PRODUCT: (ToolType.KLING, ToolType.MIDJOURNEY, "인물/제품 일관성 - 이미지 생성 후 영상화"),
+        IntentCategory.INFORMATIONAL: (ToolType.HEYGEN, None, "정보 전달 - 스크립트 기반 아바타"),
+        IntentCategory.CINEMATIC: (ToolType.SORA, None, "시네마틱 - Sora2 영화적 표현"),
+        IntentCategory.MUSIC_AUDIO: (ToolType.SUNO, None, "음악/BGM 생성"),
+        IntentCategory.UNKNOWN: (ToolType.KLING, None, "기본 영상 생성 - Kling")
+    }
+    
+    # 툴별 Gemini 프롬프트 최적화 지침
+    TOOL_INSTRUCTIONS = {
+        ToolType.VEO: "Google Veo용 프롬프트. 카메라 무빙(Drone view, FPV shot, tracking shot)과 물리적 디테일 강조.",
+        ToolType.SORA: "OpenAI Sora용 프롬프트. 시네마틱, 영화적 표현, 긴 호흡의 장면 묘사.",
+        ToolType.KLING: "Kling용 프롬프트. iPhone 촬영 스타일, 자연스러운 조명, 4K 품질.",
+        ToolType.MIDJOURNEY: "Midjourney용 프롬프트. 반드시 --ar, --v, --stylize 파라미터 포함. studio lighting, 8k 품질.",
+        ToolType.HEYGEN: "HeyGen 아바타용 스크립트. 자연스러운 발화, 전문적인 톤.",
+        ToolType.SUNO: "Suno 음악용 프롬프트. 장르, BPM, 분위기 명시. Instrumental only."
+    }
+    
     def __init__(self):
         """Initialize AI Director with Gemini"""
         self.gemini_key = os.getenv("GOOGLE_GEMINI_API_KEY")
         self.model = None
+        self.analysis_model = None
+        
+        # Gemini 분석 결과 캐시 (blake2b(정규화된 요청 문구) → 파싱된 JSON)
+        self._analysis_results: TTLCache = TTLCache(
+            maxsize=ANALYSIS_RESULT_CACHE_SIZE,
+            ttl=ANALYSIS_RESULT_CACHE_TTL
+        )
         
         if self.gemini_key:
             genai.configure(api_key=self.gemini_key)
             self.model = genai.GenerativeModel('gemini-2.0-flash')
+            # 의도 분석은 고정 지시문을 system_instruction으로 분리 (사용자 턴만 요청마다 변경)
+            self.analysis_model = genai.GenerativeModel(
+                'gemini-2.0-flash',
+                system_instruction=ANALYSIS_SYSTEM_PROMPT
+            )
             print("✅ [AI Director] Gemini 2.0 Flash 초기화 완료")
         else:
             print("⚠️ [AI Director] Gemini API 키 없음 - 규칙 기반 모드")
     
-    async def analyze_intent(self, user_input: str, context: Optional[Dict] = None) -> DirectorAnalysis:
+    async def analyze_intent(
+        self,
+        user_input: str,
+        context: Optional[Dict] = None,
+        use_gemini: bool = True
+    ) -> DirectorAnalysis:
         """
         사용자 의도 분석 및 최적 툴 결정
         
         Args:
             user_input: 사용자 입력 텍스트
             context: 추가 컨텍스트 (이전 대화, 프로젝트 설정 등)
+            use_gemini: False면 키워드 분석만 수행 (스트리밍 미리보기용)
         
         Returns:
             DirectorAnalysis: 분석 결과 및 라우팅 결정
@@ -178,7 +285,7 @@ class AIDirector:
         detected_keywords = self._extract_keywords(user_input)
         
         # 2. Gemini로 정교한 분석 (가능한 경우)
-        if self.model:
+        if self.model and use_gemini:
             gemini_analysis = await self._gemini_analyze(user_input, context)
             # Gemini 결과와 키워드 결과 병합
             intent_scores = self._merge_scores(intent_scores, gemini_analysis.get("scores", {}))
@@ -203,15 +310,20 @@ class AIDirector:
             timestamp=datetime.utcnow().isoformat()
         )
     
+    def _find_keywords(self, text: str) -> set:
+        """텍스트에 포함된 키워드 (소문자) - 정규식 1회 스캔"""
+        found = set()
+        for match in _KEYWORD_RE.finditer(text.lower()):
+            found.update(_KEYWORD_EXPANSION[match.group(1)])
+        return found
+    
     def _calculate_intent_scores(self, text: str) -> Dict[str, float]:
         """키워드 기반 의도 점수 계산"""
-        text_lower = text.lower()
         scores = {category.value: 0.0 for category in IntentCategory}
         
-        for category, keywords in self.INTENT_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword.lower() in text_lower:
-                    scores[category.value] += 1.0
+        for keyword in self._find_keywords(text):
+            for category in _KEYWORD_CATEGORIES[keyword]:
+                scores[category.value] += 1.0
         
         # 정규화
         total = sum(scores.values())
@@ -224,52 +336,35 @@ class AIDirector:
     
     def _extract_keywords(self, text: str) -> List[str]:
         """텍스트에서 키워드 추출"""
-        text_lower = text.lower()
-        found = []
-        
-        for keywords in self.INTENT_KEYWORDS.values():
-            for keyword in keywords:
-                if keyword.lower() in text_lower:
-                    found.append(keyword)
-        
-        return list(set(found))
+        return list({
+            original
+            for keyword in self._find_keywords(text)
+            for original in _KEYWORD_ORIGINALS[keyword]
+        })
     
     async def _gemini_analyze(self, user_input: str, context: Optional[Dict]) -> Dict:
         """Gemini로 정교한 의도 분석"""
+        # 프롬프트는 요청 문구만으로 구성되므로 (정규화된) 문구 기준으로 캐시
+        cache_key = _analysis_cache_key(user_input)
+        cached = self._analysis_results.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            prompt = f"""당신은 영상 제작 AI Director입니다. 
-사용자의 요청을 분석하여 최적의 AI 툴을 결정해야 합니다.
-
-[사용자 요청]
-{user_input}
-
-[사용 가능한 툴]
-1. VEO: 리얼리즘, 물리 법칙, 자동차, 스포츠, 액션
-2. KLING: 범용 영상, 일반적인 콘텐츠
-3. SORA: 시네마틱, 영화적 배경, 드라마틱
-4. MIDJOURNEY: 이미지 생성, 캐릭터 디자인
-5. HEYGEN: AI 아바타, 발표자, 뉴스 리포터
-6. SUNO: 음악, BGM, 효과음
-
-[응답 형식 - JSON만 출력]
-{{
-  "primary_tool": "VEO|KLING|SORA|MIDJOURNEY|HEYGEN|SUNO",
-  "secondary_tool": "null 또는 툴명",
-  "intent": "realism_action|character_product|informational|cinematic|music_audio",
-  "confidence": 0.0-1.0,
-  "reasoning": "선택 이유 한 줄"
-}}"""
+            prompt = f"""[사용자 요청]
+{user_input}"""
 
-            response = self.model.generate_content(prompt)
+            response = await self.analysis_model.generate_content_async(prompt)
             
-            # JSON 추출
-            text = response.text
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0]
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0]
+            # implicit cache 적중 확인용
+            usage = getattr(response, "usage_metadata", None)
+            cached_tokens = getattr(usage, "cached_content_token_count", 0) if usage else 0
+            if cached_tokens:
+                print(f"💾 [Gemini Analysis] 캐시 적중: {cached_tokens} tokens")
             
-            return json.loads(text.strip())
+            result = await loads_json(strip_json_fence(response.text))
+            self._analysis_results[cache_key] = result
+            return result
             
         except Exception as e:
             print(f"⚠️ [Gemini Analysis] 오류: {e}")
@@ -307,17 +402,7 @@ class AIDirector:
         ✔️ Veo3.1은 text_to_video 및 image_to_video 모두 지원
         """
         
-        # 스마트 라우팅 맵 - 의도별 최적 툴 선택
-        routing_map = {
-            IntentCategory.REALISM_ACTION: (ToolType.VEO, None, "액션/리얼리즘 - Veo3.1 물리법칙 적용"),
-            IntentCategory.CHARACTER_PRODUCT: (ToolType.KLING, ToolType.MIDJOURNEY, "인물/제품 일관성 - 이미지 생성 후 영상화"),
-            IntentCategory.INFORMATIONAL: (ToolType.HEYGEN, None, "정보 전달 - 스크립트 기반 아바타"),
-            IntentCategory.CINEMATIC: (ToolType.SORA, None, "시네마틱 - Sora2 영화적 표현"),
-            IntentCategory.MUSIC_AUDIO: (ToolType.SUNO, None, "음악/BGM 생성"),
-            IntentCategory.UNKNOWN: (ToolType.KLING, None, "기본 영상 생성 - Kling")
-        }
-        
-        primary, secondary, reasoning = routing_map.get(
+        primary, secondary, reasoning = self.ROUTING_MAP.get(
             intent, 
             (ToolType.KLING, None, "기본값")
         )
@@ -361,15 +446,6 @@ class AIDirector:
             template = self.PROMPT_TEMPLATES.get(tool, {})
             return f"{template.get('prefix', '')}{prompt}{template.get('suffix', '')}"
         
-        tool_instructions = {
-            ToolType.VEO: "Google Veo용 프롬프트. 카메라 무빙(Drone view, FPV shot, tracking shot)과 물리적 디테일 강조.",
-            ToolType.SORA: "OpenAI Sora용 프롬프트. 시네마틱, 영화적 표현, 긴 호흡의 장면 묘사.",
-            ToolType.KLING: "Kling용 프롬프트. iPhone 촬영 스타일, 자연스러운 조명, 4K 품질.",
-            ToolType.MIDJOURNEY: "Midjourney용 프롬프트. 반드시 --ar, --v, --stylize 파라미터 포함. studio lighting, 8k 품질.",
-            ToolType.HEYGEN: "HeyGen 아바타용 스크립트. 자연스러운 발화, 전문적인 톤.",
-            ToolType.SUNO: "Suno 음악용 프롬프트. 장르, BPM, 분위기 명시. Instrumental only."
-        }
-        
         try:
             gemini_prompt = f"""다음 프롬프트를 {tool.value.upper()}에 최적화해주세요.
 
@@ -377,12 +453,12 @@ class AIDirector:
 {prompt}
 
 [최적화 지침]
-{tool_instructions.get(tool, "고품질 결과를 위한 최적화")}
+{self.TOOL_INSTRUCTIONS.get(tool, "고품질 결과를 위한 최적화")}
 
 [응답]
 최적화된 프롬프트만 출력하세요. 설명 없이 프롬프트 텍스트만."""
 
-            response = self.model.generate_content(gemini_prompt)
+            response = await self.model.generate_content_async(gemini_prompt)
             return response.text.strip()
             
         except Exception as e:
@@ -409,7 +485,7 @@ class AIDirector:
 
 [스크립트]"""
 
-            response = self.model.generate_content(prompt)
+            response = await self.model.generate_content_async(prompt)
             return response.text.strip()
             
         except Exception as e:
@@ -433,7 +509,7 @@ Instrumental only, [장르], [BPM 범위], [분위기 키워드], high fidelity
 
 프롬프트만 출력하세요."""
 
-            response = self.model.generate_content(prompt)
+            response = await self.model.generate_content_async(prompt)
             return response.text.strip()
             
         except Exception as e:
@@ -441,6 +517,42 @@ Instrumental only, [장르], [BPM 범위], [분위기 키워드], high fidelity
             return f"Instrumental only, cinematic, 90-120 BPM, {mood}, high fidelity"
 
 
+# ============================================
+# Keyword Index (INTENT_KEYWORDS 전체를 정규식 1개로)
+# ============================================
+
+def _build_keyword_index(intent_keywords: Dict[IntentCategory, List[str]]):
+    """
+    키워드 스캔용 인덱스 생성
+
+    - 위치마다 가장 긴 키워드를 lookahead로 매칭 (겹치는 키워드도 놓치지 않음)
+    - 매칭된 키워드에 포함된 짧은 키워드까지 확장 (예: 배경음악 → 배경)
+      → 키워드별 `in` 검사와 같은 결과
+    """
+    categories: Dict[str, List[IntentCategory]] = {}
+    originals: Dict[str, List[str]] = {}
+    for category, keywords in intent_keywords.items():
+        for keyword in keywords:
+            categories.setdefault(keyword.lower(), []).append(category)
+            originals.setdefault(keyword.lower(), []).append(keyword)
+    
+    ordered = sorted(categories, key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+    expansion = {
+        keyword: [other for other in categories if other in keyword]
+        for keyword in categories
+    }
+    return pattern, expansion, categories, originals
+
+
+(
+    _KEYWORD_RE,
+    _KEYWORD_EXPANSION,
+    _KEYWORD_CATEGORIES,
+    _KEYWORD_ORIGINALS
+) = _build_keyword_index(AIDirector.INTENT_KEYWORDS)
+
+
 # ============================================
 # Singleton Instance
 # ============================================
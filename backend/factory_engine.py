@@ -22,6 +22,36 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 
+# ============================================
+# Shared HTTP Client
+# ============================================
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    벤더 API 공용 httpx 클라이언트 (프로세스당 1개)
+
+    - 작업마다 클라이언트를 만들면 호출마다 TLS 핸드셰이크 발생 → 커넥션 풀 재사용
+    - 요청별 timeout은 호출 시 지정
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+        )
+    return _http_client
+
+
+async def close_http_client():
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 # ============================================
 # Enums
 # ============================================
@@ -239,15 +269,6 @@ class GeminiImageClient:
             message="Gemini 이미지 생성은 현재 지원되지 않습니다. Flux 모델로 자동 전환됩니다.",
             model="gemini"
         )
-                
-        except Exception as e:
-            print(f"❌ [Gemini Image] 오류: {str(e)}")
-            return ImageResponse(
-                success=False,
-                status="error",
-                message=f"Gemini 이미지 생성 오류: {str(e)}",
-                model="gemini"
-            )
 
 
 # ============================================
@@ -262,10 +283,22 @@ class KlingOfficialClient:
     """
     
     BASE_URL = "https://api.klingai.com"
+    TOKEN_TTL = 1800            # JWT 30분 유효
+    TOKEN_REFRESH_MARGIN = 300  # 만료 5분 전 재발급
+    
+    # Kling task_status → 공통 상태
+    STATUS_MAP = {
+        "submitted": "processing",
+        "processing": "processing",
+        "succeed": "completed",
+        "failed": "failed"
+    }
     
     def __init__(self):
         self.access_key = os.getenv("KLING_ACCESS_KEY")
         self.secret_key = os.getenv("KLING_SECRET_KEY")
+        self._headers: Optional[Dict[str, str]] = None
+        self._headers_expire_at = 0.0
         
         if self.access_key and self.secret_key:
             print(f"✅ [Kling Official] API 키 설정됨: {self.access_key[:8]}...")
@@ -285,7 +318,7 @@ class KlingOfficialClient:
         now = int(time.time())
         payload = {
             "iss": self.access_key,
-            "exp": now + 1800,  # 30분 유효
+            "exp": now + self.TOKEN_TTL,
             "nbf": now - 5      # 5초 전부터 유효
         }
         
@@ -299,12 +332,16 @@ class KlingOfficialClient:
         return token
     
     def _get_headers(self) -> Dict[str, str]:
-        """인증 헤더 생성"""
-        token = self._generate_jwt_token()
-        return {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}"
-        }
+        """인증 헤더 (JWT는 만료 5분 전까지 재사용 - 상태 폴링마다 새로 서명하지 않음)"""
+        now = time.time()
+        if self._headers is None or now >= self._headers_expire_at:
+            token = self._generate_jwt_token()
+            self._headers = {
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {token}"
+            }
+            self._headers_expire_at = now + self.TOKEN_TTL - self.TOKEN_REFRESH_MARGIN
+        return self._headers
     
     @property
     def is_available(self) -> bool:
@@ -367,50 +404,51 @@ class KlingOfficialClient:
         print(f"   프롬프트: {enhanced_prompt[:80]}...")
         
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    url,
-                    headers=self._get_headers(),
-                    json=body
-                )
-                
-                print(f"📡 [Kling Official] HTTP {response.status_code}")
+            client = get_http_client()
+            response = await client.post(
+                url,
+                headers=self._get_headers(),
+                json=body,
+                timeout=60.0
+            )
+            
+            print(f"📡 [Kling Official] HTTP {response.status_code}")
+            
+            if response.status_code == 200:
+                data = response.json()
                 
-                if response.status_code == 200:
-                    data = response.json()
+                # Kling API 응답 구조 처리
+                if data.get("code") == 0:
+                    task_data = data.get("data", {})
+                    task_id = task_data.get("task_id")
                     
-                    # Kling API 응답 구조 처리
-                    if data.get("code") == 0:
-                        task_data = data.get("data", {})
-                        task_id = task_data.get("task_id")
-                        
-                        print(f"✅ [Kling Official] 작업 생성 성공: {task_id}")
-                        
-                        return VideoResponse(
-                            success=True,
-                            task_id=task_id,
-                            status="processing",
-                            message="Kling Official 영상 생성 시작",
-                            model="kling_official",
-                            progress=10
-                        )
-                    else:
-                        error_msg = data.get("message", "알 수 없는 오류")
-                        print(f"❌ [Kling Official] API 오류: {error_msg}")
-                        return VideoResponse(
-                            success=False,
-                            status="error",
-                            message=f"Kling API 오류: {error_msg}"
-                        )
+                    print(f"✅ [Kling Official] 작업 생성 성공: {task_id}")
+                    
+                    return VideoResponse(
+                        success=True,
+                        task_id=task_id,
+                        status="processing",
+                        message="Kling Official 영상 생성 시작",
+                        model="kling_official",
+                        progress=10
+                    )
                 else:
-                    error_text = response.text[:200]
-                    print(f"❌ [Kling Official] HTTP 오류: {response.status_code}")
-                    print(f"   응답: {error_text}")
+                    error_msg = data.get("message", "알 수 없는 오류")
+                    print(f"❌ [Kling Official] API 오류: {error_msg}")
                     return VideoResponse(
                         success=False,
                         status="error",
-                        message=f"Kling Official API 오류: {response.status_code}"
+                        message=f"Kling API 오류: {error_msg}"
                     )
+            else:
+                error_text = response.text[:200]
+                print(f"❌ [Kling Official] HTTP 오류: {response.status_code}")
+                print(f"   응답: {error_text}")
+                return VideoResponse(
+                    success=False,
+                    status="error",
+                    message=f"Kling Official API 오류: {response.status_code}"
+                )
                     
         except Exception as e:
             print(f"❌ [Kling Official] 예외: {e}")
@@ -430,54 +468,47 @@ class KlingOfficialClient:
         url = f"{self.BASE_URL}/v1/videos/text2video/{task_id}"
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, headers=self._get_headers())
+            client = get_http_client()
+            response = await client.get(url, headers=self._get_headers(), timeout=30.0)
+            
+            if response.status_code == 200:
+                data = response.json()
                 
-                if response.status_code == 200:
-                    data = response.json()
+                if data.get("code") == 0:
+                    task_data = data.get("data", {})
+                    status = task_data.get("task_status", "processing")
                     
-                    if data.get("code") == 0:
-                        task_data = data.get("data", {})
-                        status = task_data.get("task_status", "processing")
-                        
-                        # 상태 매핑
-                        status_map = {
-                            "submitted": "processing",
-                            "processing": "processing",
-                            "succeed": "completed",
-                            "failed": "failed"
-                        }
-                        
-                        mapped_status = status_map.get(status, status)
-                        video_url = None
-                        progress = 50
-                        
-                        if mapped_status == "completed":
-                            # 비디오 URL 추출
-                            works = task_data.get("task_result", {}).get("videos", [])
-                            if works:
-                                video_url = works[0].get("url")
-                            progress = 100
-                            print(f"✅ [Kling Official] 완료! URL: {video_url}")
-                            
-                        elif mapped_status == "failed":
-                            progress = 0
-                            print(f"❌ [Kling Official] 작업 실패")
+                    # 상태 매핑
+                    mapped_status = self.STATUS_MAP.get(status, status)
+                    video_url = None
+                    progress = 50
+                    
+                    if mapped_status == "completed":
+                        # 비디오 URL 추출
+                        works = task_data.get("task_result", {}).get("videos", [])
+                        if works:
+                            video_url = works[0].get("url")
+                        progress = 100
+                        print(f"✅ [Kling Official] 완료! URL: {video_url}")
                         
-                        return VideoResponse(
-                            success=True,
-                            task_id=task_id,
-                            video_url=video_url,
-                            status=mapped_status,
-                            progress=progress,
-                            model="kling_official"
-                        )
+                    elif mapped_status == "failed":
+                        progress = 0
+                        print(f"❌ [Kling Official] 작업 실패")
                     
-                return VideoResponse(
-                    success=False,
-                    status="error",
-                    message=f"상태 조회 실패: {response.status_code}"
-                )
+                    return VideoResponse(
+                        success=True,
+                        task_id=task_id,
+                        video_url=video_url,
+                        status=mapped_status,
+                        progress=progress,
+                        model="kling_official"
+                    )
+                
+            return VideoResponse(
+                success=False,
+                status="error",
+                message=f"상태 조회 실패: {response.status_code}"
+            )
                     
         except Exception as e:
             return VideoResponse(
@@ -626,44 +657,44 @@ class GoAPIClient:
         print(f"{'='*60}")
         
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(url, headers=self._get_headers(), json=body)
-                
-                print(f"📡 [GoAPI] HTTP {response.status_code}")
+            client = get_http_client()
+            response = await client.post(url, headers=self._get_headers(), json=body, timeout=60.0)
+            
+            print(f"📡 [GoAPI] HTTP {response.status_code}")
+            
+            if response.status_code == 200:
+                data = response.json()
                 
-                if response.status_code == 200:
-                    data = response.json()
+                if data.get("code") == 200:
+                    task_id = data.get("data", {}).get("task_id")
+                    print(f"✅ [GoAPI] 작업 생성: {task_id}")
                     
-                    if data.get("code") == 200:
-                        task_id = data.get("data", {}).get("task_id")
-                        print(f"✅ [GoAPI] 작업 생성: {task_id}")
-                        
-                        return VideoResponse(
-                            success=True,
-                            task_id=task_id,
-                            status="processing",
-                            message="영상 생성이 시작되었습니다.",
-                            model=request.model.value,
-                            progress=10
-                        )
-                    else:
-                        error_msg = data.get("message", "알 수 없는 오류")
-                        print(f"❌ [GoAPI] 오류: {error_msg}")
-                        return VideoResponse(
-                            success=False,
-                            status="error",
-                            message=f"현재 AI 공급사(GoAPI) 서버 점검 중입니다. 잠시 후 다시 시도해주세요. (코드: {error_msg})",
-                            model=request.model.value
-                        )
+                    return VideoResponse(
+                        success=True,
+                        task_id=task_id,
+                        status="processing",
+                        message="영상 생성이 시작되었습니다.",
+                        model=request.model.value,
+                        progress=10
+                    )
                 else:
-                    # 500/503 등 서버 오류
-                    friendly_msg = "현재 AI 공급사(GoAPI) 서버 점검 중입니다. 잠시 후 다시 시도해주세요."
+                    error_msg = data.get("message", "알 수 없는 오류")
+                    print(f"❌ [GoAPI] 오류: {error_msg}")
                     return VideoResponse(
                         success=False,
                         status="error",
-                        message=f"{friendly_msg} (HTTP {response.status_code})",
+                        message=f"현재 AI 공급사(GoAPI) 서버 점검 중입니다. 잠시 후 다시 시도해주세요. (코드: {error_msg})",
                         model=request.model.value
                     )
+            else:
+                # 500/503 등 서버 오류
+                friendly_msg = "현재 AI 공급사(GoAPI) 서버 점검 중입니다. 잠시 후 다시 시도해주세요."
+                return VideoResponse(
+                    success=False,
+                    status="error",
+                    message=f"{friendly_msg} (HTTP {response.status_code})",
+                    model=request.model.value
+                )
                     
         except Exception as e:
             print(f"❌ [GoAPI] 예외: {e}")
@@ -712,33 +743,33 @@ class GoAPIClient:
         print(f"   스타일: {request.style}")
         
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(url, headers=self._get_headers(), json=body)
+            client = get_http_client()
+            response = await client.post(url, headers=self._get_headers(), json=body, timeout=60.0)
+            
+            if response.status_code == 200:
+                data = response.json()
                 
-                if response.status_code == 200:
-                    data = response.json()
+                if data.get("code") == 200:
+                    task_id = data.get("data", {}).get("task_id")
+                    print(f"✅ [{audio_model.value.upper()}] 작업 생성: {task_id}")
                     
-                    if data.get("code") == 200:
-                        task_id = data.get("data", {}).get("task_id")
-                        print(f"✅ [{audio_model.value.upper()}] 작업 생성: {task_id}")
-                        
-                        return MusicResponse(
-                            success=True,
-                            task_id=task_id,
-                            status="processing",
-                            message=f"{audio_model.value.upper()} 음악 생성이 시작되었습니다.",
-                            model=audio_model.value
-                        )
-                
-                # 오류 반환 (Fallback 가능)
-                # 500/503 서버 오류
-                friendly_msg = f"현재 {audio_model.value.upper()} 음악 서버 점검 중입니다."
-                return MusicResponse(
-                    success=False,
-                    status="error",
-                    message=f"{friendly_msg} (HTTP {response.status_code})",
-                    model=audio_model.value
-                )
+                    return MusicResponse(
+                        success=True,
+                        task_id=task_id,
+                        status="processing",
+                        message=f"{audio_model.value.upper()} 음악 생성이 시작되었습니다.",
+                        model=audio_model.value
+                    )
+            
+            # 오류 반환 (Fallback 가능)
+            # 500/503 서버 오류
+            friendly_msg = f"현재 {audio_model.value.upper()} 음악 서버 점검 중입니다."
+            return MusicResponse(
+                success=False,
+                status="error",
+                message=f"{friendly_msg} (HTTP {response.status_code})",
+                model=audio_model.value
+            )
                 
         except Exception as e:
             return MusicResponse(
@@ -873,35 +904,35 @@ class GoAPIClient:
         print(f"   프롬프트: {request.prompt[:80]}...")
         
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(url, headers=self._get_headers(), json=body)
+            client = get_http_client()
+            response = await client.post(url, headers=self._get_headers(), json=body, timeout=60.0)
+            
+            if response.status_code == 200:
+                data = response.json()
                 
-                if response.status_code == 200:
-                    data = response.json()
+                if data.get("code") == 200:
+                    task_id = data.get("data", {}).get("task_id")
+                    print(f"✅ [{request.model.value.upper()}] 이미지 작업 생성: {task_id}")
                     
-                    if data.get("code") == 200:
-                        task_id = data.get("data", {}).get("task_id")
-                        print(f"✅ [{request.model.value.upper()}] 이미지 작업 생성: {task_id}")
-                        
-                        return ImageResponse(
-                            success=True,
-                            task_id=task_id,
-                            status="processing",
-                            message=f"{request.model.value.upper()} 이미지 생성이 시작되었습니다.",
-                            model=request.model.value
-                        )
-                
-                # 상세 오류 로깅
-                error_detail = response.text[:500] if response.text else "No response body"
-                print(f"❌ [Image API] 오류: {response.status_code} - {error_detail}")
-                
-                friendly_msg = "현재 AI 공급사(GoAPI) 이미지 서버 점검 중입니다. 잠시 후 다시 시도해주세요."
-                return ImageResponse(
-                    success=False,
-                    status="error",
-                    message=f"{friendly_msg} (HTTP {response.status_code})",
-                    model=request.model.value
-                )
+                    return ImageResponse(
+                        success=True,
+                        task_id=task_id,
+                        status="processing",
+                        message=f"{request.model.value.upper()} 이미지 생성이 시작되었습니다.",
+                        model=request.model.value
+                    )
+            
+            # 상세 오류 로깅
+            error_detail = response.text[:500] if response.text else "No response body"
+            print(f"❌ [Image API] 오류: {response.status_code} - {error_detail}")
+            
+            friendly_msg = "현재 AI 공급사(GoAPI) 이미지 서버 점검 중입니다. 잠시 후 다시 시도해주세요."
+            return ImageResponse(
+                success=False,
+                status="error",
+                message=f"{friendly_msg} (HTTP {response.status_code})",
+                model=request.model.value
+            )
                 
         except Exception as e:
             return ImageResponse(
@@ -920,57 +951,57 @@ class GoAPIClient:
         url = f"{self.BASE_URL}/task/{task_id}"
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, headers=self._get_headers())
+            client = get_http_client()
+            response = await client.get(url, headers=self._get_headers(), timeout=30.0)
+            
+            if response.status_code == 200:
+                data = response.json()
                 
-                if response.status_code == 200:
-                    data = response.json()
+                if data.get("code") == 200:
+                    task_data = data.get("data", {})
+                    status = task_data.get("status", "processing")
+                    output = task_data.get("output", {})
                     
-                    if data.get("code") == 200:
-                        task_data = data.get("data", {})
-                        status = task_data.get("status", "processing")
-                        output = task_data.get("output", {})
-                        
-                        image_url = None
-                        
-                        if status in ["completed", "succeed"]:
-                            # Flux/Midjourney 이미지 URL 추출
-                            images = output.get("images", [])
-                            if images:
-                                image_url = images[0].get("url") or images[0]
-                            else:
-                                image_url = output.get("image_url") or output.get("url")
-                            
-                            print(f"✅ [Image] 완료! URL: {image_url}")
-                            
-                            return ImageResponse(
-                                success=True,
-                                task_id=task_id,
-                                image_url=image_url,
-                                status="completed",
-                                message="이미지 생성 완료"
-                            )
+                    image_url = None
+                    
+                    if status in ["completed", "succeed"]:
+                        # Flux/Midjourney 이미지 URL 추출
+                        images = output.get("images", [])
+                        if images:
+                            image_url = images[0].get("url") or images[0]
+                        else:
+                            image_url = output.get("image_url") or output.get("url")
                         
-                        elif status == "failed":
-                            return ImageResponse(
-                                success=False,
-                                task_id=task_id,
-                                status="failed",
-                                message=f"이미지 생성 실패: {task_data.get('error', {})}"
-                            )
+                        print(f"✅ [Image] 완료! URL: {image_url}")
                         
                         return ImageResponse(
                             success=True,
                             task_id=task_id,
-                            status=status,
-                            message="이미지 생성 중..."
+                            image_url=image_url,
+                            status="completed",
+                            message="이미지 생성 완료"
                         )
-                
-                return ImageResponse(
-                    success=False,
-                    status="error",
-                    message="상태 조회 실패"
-                )
+                    
+                    elif status == "failed":
+                        return ImageResponse(
+                            success=False,
+                            task_id=task_id,
+                            status="failed",
+                            message=f"이미지 생성 실패: {task_data.get('error', {})}"
+                        )
+                    
+                    return ImageResponse(
+                        success=True,
+                        task_id=task_id,
+                        status=status,
+                        message="이미지 생성 중..."
+                    )
+            
+            return ImageResponse(
+                success=False,
+                status="error",
+                message="상태 조회 실패"
+            )
                 
         except Exception as e:
             return ImageResponse(
@@ -988,66 +1019,66 @@ class GoAPIClient:
         url = f"{self.BASE_URL}/task/{task_id}"
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, headers=self._get_headers())
+            client = get_http_client()
+            response = await client.get(url, headers=self._get_headers(), timeout=30.0)
+            
+            if response.status_code == 200:
+                data = response.json()
                 
-                if response.status_code == 200:
-                    data = response.json()
+                if data.get("code") == 200:
+                    task_data = data.get("data", {})
+                    status = task_data.get("status", "processing")
+                    output = task_data.get("output", {})
+                    
+                    video_url = None
+                    progress = 50
                     
-                    if data.get("code") == 200:
-                        task_data = data.get("data", {})
-                        status = task_data.get("status", "processing")
-                        output = task_data.get("output", {})
+                    if status in ["completed", "succeed"]:
+                        # 비디오 URL 추출
+                        works = output.get("works", [])
+                        if works:
+                            work = works[0]
+                            video_url = (
+                                work.get("video", {}).get("resource") or
+                                work.get("video", {}).get("resource_without_watermark") or
+                                work.get("resource", {}).get("resource") or
+                                output.get("video_url")
+                            )
                         
-                        video_url = None
-                        progress = 50
+                        # Veo3.1 특수 처리
+                        if not video_url and model == VideoModel.VEO:
+                            video_url = output.get("video_url") or output.get("url")
                         
-                        if status in ["completed", "succeed"]:
-                            # 비디오 URL 추출
-                            works = output.get("works", [])
-                            if works:
-                                work = works[0]
-                                video_url = (
-                                    work.get("video", {}).get("resource") or
-                                    work.get("video", {}).get("resource_without_watermark") or
-                                    work.get("resource", {}).get("resource") or
-                                    output.get("video_url")
-                                )
-                            
-                            # Veo3.1 특수 처리
-                            if not video_url and model == VideoModel.VEO:
-                                video_url = output.get("video_url") or output.get("url")
-                            
-                            progress = 100
-                            status = "completed"
-                            print(f"✅ [GoAPI] 완료! URL: {video_url}")
-                            
-                        elif status == "failed":
-                            progress = 0
-                            error = task_data.get("error", {})
-                            print(f"❌ [GoAPI] 실패: {error}")
-                            
-                        elif status == "pending":
-                            progress = 10
-                            
-                        elif status == "processing":
-                            progress = min(90, max(20, output.get("status", 0)))
+                        progress = 100
+                        status = "completed"
+                        print(f"✅ [GoAPI] 완료! URL: {video_url}")
                         
-                        return VideoResponse(
-                            success=True,
-                            task_id=task_id,
-                            video_url=video_url,
-                            status=status,
-                            progress=progress,
-                            model=model.value
-                        )
+                    elif status == "failed":
+                        progress = 0
+                        error = task_data.get("error", {})
+                        print(f"❌ [GoAPI] 실패: {error}")
                         
-                return VideoResponse(
-                    success=False,
-                    status="error",
-                    message=f"상태 조회 실패",
-                    model=model.value
-                )
+                    elif status == "pending":
+                        progress = 10
+                        
+                    elif status == "processing":
+                        progress = min(90, max(20, output.get("status", 0)))
+                    
+                    return VideoResponse(
+                        success=True,
+                        task_id=task_id,
+                        video_url=video_url,
+                        status=status,
+                        progress=progress,
+                        model=model.value
+                    )
+                    
+            return VideoResponse(
+                success=False,
+                status="error",
+                message=f"상태 조회 실패",
+                model=model.value
+            )
                 
         except Exception as e:
             return VideoResponse(
@@ -1121,28 +1152,28 @@ class HeyGenClient:
         print(f"🎭 [HeyGen] 아바타 영상 생성")
         
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(url, headers=self._get_headers(), json=body)
+            client = get_http_client()
+            response = await client.post(url, headers=self._get_headers(), json=body, timeout=60.0)
+            
+            if response.status_code == 200:
+                data = response.json()
+                video_id = data.get("data", {}).get("video_id")
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    video_id = data.get("data", {}).get("video_id")
-                    
-                    return VideoResponse(
-                        success=True,
-                        task_id=video_id,
-                        status="processing",
-                        message="HeyGen 아바타 영상 생성 시작",
-                        model="heygen",
-                        progress=10
-                    )
-                    
                 return VideoResponse(
-                    success=False,
-                    status="error",
-                    message=f"HeyGen API 오류: {response.status_code}"
+                    success=True,
+                    task_id=video_id,
+                    status="processing",
+                    message="HeyGen 아바타 영상 생성 시작",
+                    model="heygen",
+                    progress=10
                 )
                 
+            return VideoResponse(
+                success=False,
+                status="error",
+                message=f"HeyGen API 오류: {response.status_code}"
+            )
+                
         except Exception as e:
             return VideoResponse(
                 success=False,
@@ -1159,39 +1190,40 @@ class HeyGenClient:
         url = f"{self.BASE_URL}/v1/video_status.get"
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    url,
-                    headers=self._get_headers(),
-                    params={"video_id": video_id}
-                )
+            client = get_http_client()
+            response = await client.get(
+                url,
+                headers=self._get_headers(),
+                params={"video_id": video_id},
+                timeout=30.0
+            )
+            
+            if response.status_code == 200:
+                data = response.json().get("data", {})
+                status = data.get("status", "processing")
+                video_url = data.get("video_url")
+                
+                progress = 50
+                if status == "completed":
+                    progress = 100
+                elif status == "failed":
+                    progress = 0
                 
-                if response.status_code == 200:
-                    data = response.json().get("data", {})
-                    status = data.get("status", "processing")
-                    video_url = data.get("video_url")
-                    
-                    progress = 50
-                    if status == "completed":
-                        progress = 100
-                    elif status == "failed":
-                        progress = 0
-                    
-                    return VideoResponse(
-                        success=True,
-                        task_id=video_id,
-                        video_url=video_url,
-                        status=status,
-                        progress=progress,
-                        model="heygen"
-                    )
-                    
                 return VideoResponse(
-                    success=False,
-                    status="error",
-                    message=f"상태 조회 실패: {response.status_code}"
+                    success=True,
+                    task_id=video_id,
+                    video_url=video_url,
+                    status=status,
+                    progress=progress,
+                    model="heygen"
                 )
                 
+            return VideoResponse(
+                success=False,
+                status="error",
+                message=f"상태 조회 실패: {response.status_code}"
+            )
+                
         except Exception as e:
             return VideoResponse(
                 success=False,
@@ -1208,29 +1240,29 @@ class HeyGenClient:
         url = f"{self.BASE_URL}/v2/avatars"
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, headers=self._get_headers())
+            client = get_http_client()
+            response = await client.get(url, headers=self._get_headers(), timeout=30.0)
+            
+            if response.status_code == 200:
+                data = response.json()
+                avatars = data.get("data", {}).get("avatars", [])
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    avatars = data.get("data", {}).get("avatars", [])
-                    
-                    # 아바타 정보 정리
-                    result = []
-                    for avatar in avatars:
-                        result.append({
-                            "avatar_id": avatar.get("avatar_id"),
-                            "avatar_name": avatar.get("avatar_name"),
-                            "gender": avatar.get("gender"),
-                            "preview_image_url": avatar.get("preview_image_url"),
-                            "preview_video_url": avatar.get("preview_video_url")
-                        })
-                    
-                    print(f"✅ [HeyGen] {len(result)}개 아바타 조회됨")
-                    return result
-                else:
-                    print(f"❌ [HeyGen] 아바타 목록 조회 실패: {response.status_code}")
-                    return []
+                # 아바타 정보 정리
+                result = []
+                for avatar in avatars:
+                    result.append({
+                        "avatar_id": avatar.get("avatar_id"),
+                        "avatar_name": avatar.get("avatar_name"),
+                        "gender": avatar.get("gender"),
+                        "preview_image_url": avatar.get("preview_image_url"),
+                        "preview_video_url": avatar.get("preview_video_url")
+                    })
+                
+                print(f"✅ [HeyGen] {len(result)}개 아바타 조회됨")
+                return result
+            else:
+                print(f"❌ [HeyGen] 아바타 목록 조회 실패: {response.status_code}")
+                return []
                     
         except Exception as e:
             print(f"❌ [HeyGen] 아바타 목록 조회 오류: {e}")
@@ -1245,28 +1277,28 @@ class HeyGenClient:
         url = f"{self.BASE_URL}/v2/voices"
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, headers=self._get_headers())
+            client = get_http_client()
+            response = await client.get(url, headers=self._get_headers(), timeout=30.0)
+            
+            if response.status_code == 200:
+                data = response.json()
+                voices = data.get("data", {}).get("voices", [])
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    voices = data.get("data", {}).get("voices", [])
-                    
-                    result = []
-                    for voice in voices:
-                        result.append({
-                            "voice_id": voice.get("voice_id"),
-                            "name": voice.get("name"),
-                            "language": voice.get("language"),
-                            "gender": voice.get("gender"),
-                            "preview_audio": voice.get("preview_audio")
-                        })
-                    
-                    print(f"✅ [HeyGen] {len(result)}개 음성 조회됨")
-                    return result
-                else:
-                    print(f"❌ [HeyGen] 음성 목록 조회 실패: {response.status_code}")
-                    return []
+                result = []
+                for voice in voices:
+                    result.append({
+                        "voice_id": voice.get("voice_id"),
+                        "name": voice.get("name"),
+                        "language": voice.get("language"),
+                        "gender": voice.get("gender"),
+                        "preview_audio": voice.get("preview_audio")
+                    })
+                
+                print(f"✅ [HeyGen] {len(result)}개 음성 조회됨")
+                return result
+            else:
+                print(f"❌ [HeyGen] 음성 목록 조회 실패: {response.status_code}")
+                return []
                     
         except Exception as e:
             print(f"❌ [HeyGen] 음성 목록 조회 오류: {e}")
@@ -1327,28 +1359,28 @@ class CreatomateClient:
         print(f"🎨 [Creatomate] 렌더링 요청")
         
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(url, headers=self._get_headers(), json=body)
+            client = get_http_client()
+            response = await client.post(url, headers=self._get_headers(), json=body, timeout=60.0)
+            
+            if response.status_code in [200, 201]:
+                data = response.json()
+                render_id = data[0].get("id") if isinstance(data, list) else data.get("id")
                 
-                if response.status_code in [200, 201]:
-                    data = response.json()
-                    render_id = data[0].get("id") if isinstance(data, list) else data.get("id")
-                    
-                    return VideoResponse(
-                        success=True,
-                        task_id=render_id,
-                        status="processing",
-                        message="Creatomate 렌더링 시작",
-                        model="creatomate",
-                        progress=10
-                    )
-                    
                 return VideoResponse(
-                    success=False,
-                    status="error",
-                    message=f"Creatomate API 오류: {response.status_code}"
+                    success=True,
+                    task_id=render_id,
+                    status="processing",
+                    message="Creatomate 렌더링 시작",
+                    model="creatomate",
+                    progress=10
                 )
                 
+            return VideoResponse(
+                success=False,
+                status="error",
+                message=f"Creatomate API 오류: {response.status_code}"
+            )
+                
         except Exception as e:
             return VideoResponse(
                 success=False,
@@ -1365,36 +1397,36 @@ class CreatomateClient:
         url = f"{self.BASE_URL}/renders/{render_id}"
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, headers=self._get_headers())
+            client = get_http_client()
+            response = await client.get(url, headers=self._get_headers(), timeout=30.0)
+            
+            if response.status_code == 200:
+                data = response.json()
+                status = data.get("status", "rendering")
+                video_url = data.get("url")
+                
+                progress = 50
+                if status == "succeeded":
+                    status = "completed"
+                    progress = 100
+                elif status == "failed":
+                    progress = 0
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    status = data.get("status", "rendering")
-                    video_url = data.get("url")
-                    
-                    progress = 50
-                    if status == "succeeded":
-                        status = "completed"
-                        progress = 100
-                    elif status == "failed":
-                        progress = 0
-                    
-                    return VideoResponse(
-                        success=True,
-                        task_id=render_id,
-                        video_url=video_url,
-                        status=status,
-                        progress=progress,
-                        model="creatomate"
-                    )
-                    
                 return VideoResponse(
-                    success=False,
-                    status="error",
-                    message=f"상태 조회 실패: {response.status_code}"
+                    success=True,
+                    task_id=render_id,
+                    video_url=video_url,
+                    status=status,
+                    progress=progress,
+                    model="creatomate"
                 )
                 
+            return VideoResponse(
+                success=False,
+                status="error",
+                message=f"상태 조회 실패: {response.status_code}"
+            )
+                
         except Exception as e:
             return VideoResponse(
                 success=False,
@@ -1474,40 +1506,40 @@ class CreatomateClient:
         print(f"🎬 [Creatomate] 비디오 연결 요청: {len(video_urls)}개 영상")
         
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(url, headers=self._get_headers(), json=body)
+            client = get_http_client()
+            response = await client.post(url, headers=self._get_headers(), json=body, timeout=120.0)
+            
+            if response.status_code in [200, 201, 202]:
+                data = response.json()
                 
-                if response.status_code in [200, 201, 202]:
-                    data = response.json()
-                    
-                    if isinstance(data, list) and len(data) > 0:
-                        render = data[0]
-                        render_id = render.get("id")
-                        video_url = render.get("url")
-                        status = render.get("status", "processing")
-                    else:
-                        render_id = data.get("id")
-                        video_url = data.get("url")
-                        status = data.get("status", "processing")
-                    
-                    mapped_status = "completed" if status in ["succeeded", "completed"] else "processing"
-                    progress = 100 if mapped_status == "completed" else 30
-                    
-                    return VideoResponse(
-                        success=True,
-                        task_id=render_id,
-                        video_url=video_url,
-                        status=mapped_status,
-                        message=f"비디오 연결 {'완료' if mapped_status == 'completed' else '진행 중'}",
-                        model="creatomate_concat",
-                        progress=progress
-                    )
+                if isinstance(data, list) and len(data) > 0:
+                    render = data[0]
+                    render_id = render.get("id")
+                    video_url = render.get("url")
+                    status = render.get("status", "processing")
+                else:
+                    render_id = data.get("id")
+                    video_url = data.get("url")
+                    status = data.get("status", "processing")
+                
+                mapped_status = "completed" if status in ["succeeded", "completed"] else "processing"
+                progress = 100 if mapped_status == "completed" else 30
                 
                 return VideoResponse(
-                    success=False,
-                    status="error",
-                    message=f"Creatomate API 오류: {response.status_code} - {response.text[:200]}"
+                    success=True,
+                    task_id=render_id,
+                    video_url=video_url,
+                    status=mapped_status,
+                    message=f"비디오 연결 {'완료' if mapped_status == 'completed' else '진행 중'}",
+                    model="creatomate_concat",
+                    progress=progress
                 )
+            
+            return VideoResponse(
+                success=False,
+                status="error",
+                message=f"Creatomate API 오류: {response.status_code} - {response.text[:200]}"
+            )
                 
         except Exception as e:
             return VideoResponse(
@@ -1589,39 +1621,39 @@ class CreatomateClient:
         print(f"🎬🎵 [Creatomate] 비디오+음악 병합 요청: {len(video_urls)}개 영상 + BGM")
         
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(url, headers=self._get_headers(), json=body)
+            client = get_http_client()
+            response = await client.post(url, headers=self._get_headers(), json=body, timeout=120.0)
+            
+            if response.status_code in [200, 201, 202]:
+                data = response.json()
                 
-                if response.status_code in [200, 201, 202]:
-                    data = response.json()
-                    
-                    if isinstance(data, list) and len(data) > 0:
-                        render_id = data[0].get("id")
-                        video_url = data[0].get("url")
-                        status = data[0].get("status", "processing")
-                    else:
-                        render_id = data.get("id")
-                        video_url = data.get("url")
-                        status = data.get("status", "processing")
-                    
-                    mapped_status = "completed" if status in ["succeeded", "completed"] else "processing"
-                    progress = 100 if mapped_status == "completed" else 30
-                    
-                    return VideoResponse(
-                        success=True,
-                        task_id=render_id,
-                        video_url=video_url,
-                        status=mapped_status,
-                        message=f"비디오+음악 병합 {'완료' if mapped_status == 'completed' else '진행 중'}",
-                        model="creatomate_merge",
-                        progress=progress
-                    )
+                if isinstance(data, list) and len(data) > 0:
+                    render_id = data[0].get("id")
+                    video_url = data[0].get("url")
+                    status = data[0].get("status", "processing")
+                else:
+                    render_id = data.get("id")
+                    video_url = data.get("url")
+                    status = data.get("status", "processing")
+                
+                mapped_status = "completed" if status in ["succeeded", "completed"] else "processing"
+                progress = 100 if mapped_status == "completed" else 30
                 
                 return VideoResponse(
-                    success=False,
-                    status="error",
-                    message=f"Creatomate API 오류: {response.status_code}"
+                    success=True,
+                    task_id=render_id,
+                    video_url=video_url,
+                    status=mapped_status,
+                    message=f"비디오+음악 병합 {'완료' if mapped_status == 'completed' else '진행 중'}",
+                    model="creatomate_merge",
+                    progress=progress
                 )
+            
+            return VideoResponse(
+                success=False,
+                status="error",
+                message=f"Creatomate API 오류: {response.status_code}"
+            )
                 
         except Exception as e:
             return VideoResponse(
@@ -1710,38 +1742,38 @@ class CreatomateClient:
         print(f"📝 [Creatomate] 텍스트 오버레이 추가: {len(texts)}개 텍스트")
         
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(url, headers=self._get_headers(), json=body)
+            client = get_http_client()
+            response = await client.post(url, headers=self._get_headers(), json=body, timeout=60.0)
+            
+            if response.status_code in [200, 201, 202]:
+                data = response.json()
                 
-                if response.status_code in [200, 201, 202]:
-                    data = response.json()
-                    
-                    if isinstance(data, list) and len(data) > 0:
-                        render_id = data[0].get("id")
-                        video_url = data[0].get("url")
-                        status = data[0].get("status", "processing")
-                    else:
-                        render_id = data.get("id")
-                        video_url = data.get("url")
-                        status = data.get("status", "processing")
-                    
-                    mapped_status = "completed" if status in ["succeeded", "completed"] else "processing"
-                    
-                    return VideoResponse(
-                        success=True,
-                        task_id=render_id,
-                        video_url=video_url,
-                        status=mapped_status,
-                        message=f"텍스트 오버레이 {'완료' if mapped_status == 'completed' else '진행 중'}",
-                        model="creatomate_text",
-                        progress=100 if mapped_status == "completed" else 30
-                    )
+                if isinstance(data, list) and len(data) > 0:
+                    render_id = data[0].get("id")
+                    video_url = data[0].get("url")
+                    status = data[0].get("status", "processing")
+                else:
+                    render_id = data.get("id")
+                    video_url = data.get("url")
+                    status = data.get("status", "processing")
+                
+                mapped_status = "completed" if status in ["succeeded", "completed"] else "processing"
                 
                 return VideoResponse(
-                    success=False,
-                    status="error",
-                    message=f"Creatomate API 오류: {response.status_code}"
+                    success=True,
+                    task_id=render_id,
+                    video_url=video_url,
+                    status=mapped_status,
+                    message=f"텍스트 오버레이 {'완료' if mapped_status == 'completed' else '진행 중'}",
+                    model="creatomate_text",
+                    progress=100 if mapped_status == "completed" else 30
                 )
+            
+            return VideoResponse(
+                success=False,
+                status="error",
+                message=f"Creatomate API 오류: {response.status_code}"
+            )
                 
         except Exception as e:
             return VideoResponse(
@@ -1825,43 +1857,43 @@ class CreatomateClient:
         print(f"🎨 [Creatomate] 자동 편집 요청: {headline}")
         
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(url, headers=self._get_headers(), json=body)
+            client = get_http_client()
+            response = await client.post(url, headers=self._get_headers(), json=body, timeout=60.0)
+            
+            # Creatomate는 202 Accepted도 성공 응답
+            if response.status_code in [200, 201, 202]:
+                data = response.json()
                 
-                # Creatomate는 202 Accepted도 성공 응답
-                if response.status_code in [200, 201, 202]:
-                    data = response.json()
-                    
-                    # 리스트로 오는 경우와 단일 객체로 오는 경우 모두 처리
-                    if isinstance(data, list) and len(data) > 0:
-                        render = data[0]
-                        render_id = render.get("id")
-                        video_url = render.get("url")
-                        status = render.get("status", "processing")
-                    else:
-                        render_id = data.get("id")
-                        video_url = data.get("url")
-                        status = data.get("status", "processing")
-                    
-                    # status가 planned/rendering이면 processing, completed면 completed
-                    mapped_status = "completed" if status == "completed" else "processing"
-                    progress = 100 if status == "completed" else 30
-                    
-                    return VideoResponse(
-                        success=True,
-                        task_id=render_id,
-                        video_url=video_url,  # URL이 있으면 바로 반환
-                        status=mapped_status,
-                        message=f"Creatomate 편집 {'완료' if status == 'completed' else '진행 중'} (상태: {status})",
-                        model="creatomate",
-                        progress=progress
-                    )
+                # 리스트로 오는 경우와 단일 객체로 오는 경우 모두 처리
+                if isinstance(data, list) and len(data) > 0:
+                    render = data[0]
+                    render_id = render.get("id")
+                    video_url = render.get("url")
+                    status = render.get("status", "processing")
+                else:
+                    render_id = data.get("id")
+                    video_url = data.get("url")
+                    status = data.get("status", "processing")
+                
+                # status가 planned/rendering이면 processing, completed면 completed
+                mapped_status = "completed" if status == "completed" else "processing"
+                progress = 100 if status == "completed" else 30
                 
                 return VideoResponse(
-                    success=False,
-                    status="error",
-                    message=f"Creatomate API 오류: {response.status_code} - {response.text}"
+                    success=True,
+                    task_id=render_id,
+                    video_url=video_url,  # URL이 있으면 바로 반환
+                    status=mapped_status,
+                    message=f"Creatomate 편집 {'완료' if status == 'completed' else '진행 중'} (상태: {status})",
+                    model="creatomate",
+                    progress=progress
                 )
+            
+            return VideoResponse(
+                success=False,
+                status="error",
+                message=f"Creatomate API 오류: {response.status_code} - {response.text}"
+            )
                 
         except Exception as e:
             return VideoResponse(
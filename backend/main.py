@@ -11,17 +11,27 @@ Features:
 - Admin CMS for Prompt/Vendor/Trend Management
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, UploadFile, File, Form
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Depends, UploadFile, File, Form
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+from typing import Optional, List, Dict, Any, Callable, Awaitable
+from dataclasses import dataclass, replace
+from contextlib import asynccontextmanager
 from datetime import datetime
-import httpx
 import os
 import json
 import asyncio
 import uuid
+import time
+import itertools
+import hashlib
+from secrets import token_urlsafe
 import base64
+import msgspec
+import orjson
+from cachetools import TTLCache
 from enum import Enum
 from dotenv import load_dotenv
 from supabase import create_client, Client
@@ -39,20 +49,43 @@ from factory_engine import (
     VideoRequest, VideoResponse, VideoModel, AspectRatio,
     AvatarRequest, EditRequest, MusicRequest, MusicResponse, STYLE_PRESETS,
     ImageRequest, ImageResponse, ImageModel, AudioModel,
-    get_factory
+    get_factory, get_http_client, close_http_client
 )
 
 from director import (
     AIDirector, IntentCategory, ToolType, RoutingDecision,
-    DirectorAnalysis, get_director
+    DirectorAnalysis, get_director, strip_json_fence, loads_json
 )
 
+from store import HashStore, ListStore, TaskStore, TaskWriteQueue
+
 load_dotenv()
 
+# ============================================
+# JSON Response (orjson)
+# ============================================
+
+class ORJSONResponse(JSONResponse):
+    """orjson 인코딩 응답 (fastapi.responses.ORJSONResponse는 최신 버전에서 deprecated)"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 # ============================================
 # FastAPI App Configuration
 # ============================================
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 수명 주기 - startup/shutdown (공용 HTTP 클라이언트, 폴러 풀, 쓰기 큐)"""
+    await startup()
+    try:
+        yield
+    finally:
+        await shutdown()
+
+
 app = FastAPI(
     title="Studio Juai PRO API",
     description="""
@@ -66,43 +99,207 @@ app = FastAPI(
     """,
     version="4.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # ============================================
-# CORS - 모든 도메인 허용 (테스트용)
+# Unhandled Errors - CORSMiddleware 안쪽에서 500 JSON 응답
+# ============================================
+
+class ErrorResponseMiddleware:
+    """
+    처리되지 않은 예외 → global_exception_handler 응답 (순수 ASGI)
+
+    - @app.exception_handler(Exception)은 CORSMiddleware 바깥(ServerErrorMiddleware)에서 실행되어
+      오류 응답에 CORS 헤더가 빠짐 → CORS보다 먼저 등록해 안쪽에서 응답 (허용 origin 목록 그대로 적용)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            if response_started:
+                raise
+            response = await global_exception_handler(Request(scope), exc)
+            await response(scope, receive, send)
+
+
+# 나중에 등록한 미들웨어가 바깥 → CORSMiddleware가 오류 응답까지 감쌈
+app.add_middleware(ErrorResponseMiddleware)
+
+# ============================================
+# CORS - 허용 도메인 명시 (CORS_ORIGINS, 콤마 구분)
 # ============================================
+DEFAULT_CORS_ORIGINS = "http://localhost:3000,http://localhost:3001,https://studio-juai-pro.vercel.app"
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", DEFAULT_CORS_ORIGINS).split(",")
+    if origin.strip()
+]
+
+# "*" 없이 메서드/헤더를 고정 → 브라우저가 Preflight를 origin별로 24시간 캐싱
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # 모든 도메인 허용
-    allow_credentials=False,  # credentials와 *는 함께 사용 불가
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
-    allow_headers=["*"],
-    expose_headers=["*"],
+    allow_origins=CORS_ORIGINS,
+    allow_credentials=True,
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["Content-Type", "Authorization", "If-None-Match"],
+    expose_headers=["ETag"],
     max_age=86400,  # Preflight 캐싱 24시간
 )
 
+
 # ============================================
 # Global State
 # ============================================
 
+@dataclass(slots=True)
+class ProjectRecord:
+    """인메모리 프로젝트 레코드 (slots - 프로젝트당 dict 대비 메모리 절감, 필드 갱신은 속성 대입)"""
+    id: str
+    user_id: str
+    title: str
+    description: Optional[str]
+    aspect_ratio: str
+    preset: str
+    model: str
+    created_at: str
+    updated_at: str
+    status: str = "idle"
+    video_url: Optional[str] = None
+    video_status: Optional[str] = None
+    video_progress: Optional[int] = None
+
+
+# 프로젝트 ID 접미사 - 같은 시각(ns)에 생성돼도 겹치지 않도록
+_project_seq = itertools.count()
+
 # In-memory stores (Production: Redis/Supabase)
-task_store: Dict[str, Dict[str, Any]] = {}
-project_store: Dict[str, Dict[str, Any]] = {}
-prompt_templates_store: Dict[str, Dict[str, Any]] = {}
-vendor_store: Dict[str, Dict[str, Any]] = {}
-trend_store: List[str] = []
+# 사용자 프로젝트는 만료/축출하지 않음 - TTL 제한은 작업 진행 상태(task_store)에만 적용
+project_store: Dict[str, ProjectRecord] = {}
+
+# 작업 상태 - REDIS_URL 설정 시 Redis Hash (store.py)
+task_store = TaskStore("task")
+
+# 폴러 쓰기는 큐를 거쳐 writer 1개가 key별로 합쳐 저장
+task_writer = TaskWriteQueue(task_store)
+
+
+class PollerPool:
+    """
+    벤더 상태 폴러 실행기
+    
+    - BackgroundTasks는 폴링이 끝날 때까지 (최대 10분) 요청 코루틴/연결 슬롯을 붙잡음
+    - 작업마다 폴러 task 1개를 바로 띄우고 추적 (응답을 막지 않고, 대기열 없이 즉시 폴링 시작)
+    - 동시성 제한은 벤더 상태 조회 HTTP 호출에만 적용 (checks 세마포어) - sleep 중인 폴러는 슬롯을 쓰지 않음
+    """
+    
+    def __init__(self, max_concurrent_checks: int):
+        self.checks = asyncio.Semaphore(max_concurrent_checks)
+        self._tasks: set = set()
+    
+    def submit(self, poller: Callable[..., Awaitable[None]], *args):
+        task = asyncio.create_task(self._run(poller, args))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def stop(self):
+        """진행 중인 폴러 취소 (재시작 후 상태는 /api/factory/status로 조회)"""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    @staticmethod
+    async def _run(poller: Callable[..., Awaitable[None]], args: tuple):
+        try:
+            await poller(*args)
+        except Exception as e:
+            print(f"❌ [PollerPool] {poller.__name__} 오류: {e}")
+
+
+# 동시 벤더 상태 조회 수 (POLLER_CONCURRENCY) - 폴러 수 자체는 제한하지 않음
+poller_pool = PollerPool(int(os.getenv("POLLER_CONCURRENCY", "64")))
+
+# Admin CMS stores - REDIS_URL 설정 시 워커 간 공유 (store.py)
+prompt_templates_store = HashStore("prompt_templates")
+vendor_store = HashStore("vendors")
+trend_store = ListStore("trends")
+
+# ============================================
+# Lookup Tables (요청마다 재생성하지 않도록 모듈 레벨 상수)
+# ============================================
+
+RATIO_MAP: Dict[str, AspectRatio] = {
+    "16:9": AspectRatio.LANDSCAPE,
+    "9:16": AspectRatio.PORTRAIT,
+    "1:1": AspectRatio.SQUARE,
+}
+
+# 영상 생성은 4:5 피드 비율도 지원
+VIDEO_RATIO_MAP: Dict[str, AspectRatio] = {
+    **RATIO_MAP,
+    "4:5": AspectRatio.VERTICAL_FEED,
+}
+
+VIDEO_MODEL_MAP: Dict[str, VideoModel] = {
+    "kling": VideoModel.KLING,
+    "veo": VideoModel.VEO,
+    "sora": VideoModel.SORA,
+    "hailuo": VideoModel.HAILUO,
+    "luma": VideoModel.LUMA,
+    "auto": VideoModel.KLING
+}
+
+IMAGE_MODEL_MAP: Dict[str, ImageModel] = {
+    "gemini": ImageModel.GEMINI,  # 기본값 - 비용 효율적
+    "flux": ImageModel.FLUX,
+    "midjourney": ImageModel.MIDJOURNEY,
+    "dalle": ImageModel.DALLE,
+}
+
+TOOL_MAP: Dict[str, ToolType] = {
+    "kling": ToolType.KLING,
+    "veo": ToolType.VEO,
+    "sora": ToolType.SORA,
+    "midjourney": ToolType.MIDJOURNEY,
+    "heygen": ToolType.HEYGEN,
+    "suno": ToolType.SUNO
+}
 
 # Initialize on startup
 factory: FactoryEngine = None
 director: AIDirector = None
 supabase: Client = None
 
-@app.on_event("startup")
 async def startup():
-    global factory, director, supabase
+    global factory, director, supabase, _MODELS_JSON, _HEALTH_BODY_PREFIX, _ENGINE_STATUS_JSON
     factory = get_factory()
     director = get_director()
+    _MODELS_JSON = orjson.dumps({"success": True, "models": factory.get_available_models()})
+    _HEALTH_BODY_PREFIX = _build_health_prefix()
+    
+    # 프로세스 공용 HTTP 클라이언트 (factory 벤더 클라이언트와 같은 커넥션 풀, shutdown 시 종료)
+    app.state.http = get_http_client()
+    task_writer.start()
+    await task_store.start()
     
     # Supabase 클라이언트 초기화
     supabase_url = os.getenv("SUPABASE_URL")
@@ -113,16 +310,25 @@ async def startup():
     else:
         print("⚠️ [Supabase] 환경 변수 없음 - 업로드 기능 불가")
     
+    # 설정 상태 스냅샷 (Supabase 초기화 이후)
+    _ENGINE_STATUS_JSON = _build_engine_status()
+    
     # 기본 프롬프트 템플릿 로드
-    _load_default_templates()
+    await _load_default_templates()
     print("🚀 [Studio Juai PRO v5.0] 서버 시작됨 - Hybrid Engine Active")
 
 
-def _load_default_templates():
-    """기본 프롬프트 템플릿 로드"""
-    global prompt_templates_store
+async def shutdown():
+    await poller_pool.stop()
+    await task_writer.stop()
+    await task_store.stop()
+    await close_http_client()
+
+
+async def _load_default_templates():
+    """기본 프롬프트 템플릿 로드 (이미 저장된 템플릿은 유지)"""
     
-    prompt_templates_store = {
+    await prompt_templates_store.set_defaults({
         "shopping_mall": {
             "id": "shopping_mall",
             "name": "쇼핑몰용 프롬프트",
@@ -159,7 +365,7 @@ def _load_default_templates():
             "default_model": "veo",
             "default_style": "vibrant"
         }
-    }
+    })
 
 
 # ============================================
@@ -171,9 +377,11 @@ class AuthRequest(BaseModel):
 
 
 class ChatRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
     user_id: str
     message: str
-    context: Optional[Dict[str, Any]] = None
+    context: Optional[dict] = None
     session_id: Optional[str] = None
     project_id: Optional[str] = None
 
@@ -188,6 +396,8 @@ class ChatResponse(BaseModel):
 
 
 class VideoGenerateRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
     project_id: str
     prompt: str
     model: str = "auto"  # auto, kling, veo, sora, hailuo, luma
@@ -299,11 +509,12 @@ class TrendRequest(BaseModel):
 # Global Exception Handler - 모든 에러를 JSON으로 반환
 # ============================================
 from fastapi import Request
-from fastapi.responses import JSONResponse
 
-@app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    """모든 예외를 잡아서 JSON 형태로 반환 (프론트엔드 디버깅용)"""
+    """
+    모든 예외를 잡아서 JSON 형태로 반환 (프론트엔드 디버깅용)
+    - ErrorResponseMiddleware에서 호출 - CORS 헤더는 CORSMiddleware가 허용 origin 기준으로 추가
+    """
     error_detail = str(exc)
     print(f"❌ [GLOBAL ERROR] {request.method} {request.url.path}: {error_detail}")
     
@@ -315,11 +526,6 @@ async def global_exception_handler(request: Request, exc: Exception):
             "path": str(request.url.path),
             "method": request.method,
             "timestamp": datetime.utcnow().isoformat()
-        },
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "*",
-            "Access-Control-Allow-Headers": "*",
         }
     )
 
@@ -328,22 +534,20 @@ async def global_exception_handler(request: Request, exc: Exception):
 # Health & Root Endpoints
 # ============================================
 
-@app.get("/")
-async def root():
-    return {
-        "status": "active",
-        "service": "Studio Juai PRO",
-        "version": "4.0.0",
-        "engine": "AI Director + Hybrid Factory",
-        "timestamp": datetime.utcnow().isoformat()
-    }
+# 헬스체크/루트 응답은 timestamp만 바뀜 → 나머지는 미리 직렬화 (닫는 "}" 제외)
+_ROOT_BODY_PREFIX: bytes = orjson.dumps({
+    "status": "active",
+    "service": "Studio Juai PRO",
+    "version": "4.0.0",
+    "engine": "AI Director + Hybrid Factory"
+})[:-1]
+_HEALTH_BODY_PREFIX: bytes = b""  # startup에서 서비스 설정 상태로 생성
 
 
-@app.get("/api/health")
-async def health_check():
-    return {
+def _build_health_prefix() -> bytes:
+    """서비스 설정 상태 스냅샷 (환경 변수는 실행 중 바뀌지 않음)"""
+    return orjson.dumps({
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
         "services": {
             "director": "active" if director else "inactive",
             "goapi": "configured" if os.getenv("GOAPI_KEY") else "not_configured",
@@ -359,7 +563,22 @@ async def health_check():
             "auto_editing": True,
             "avatar_generation": True
         }
-    }
+    })[:-1]
+
+
+def _timestamped_response(prefix: bytes) -> Response:
+    body = prefix + b',"timestamp":"' + datetime.utcnow().isoformat().encode() + b'"}'
+    return Response(content=body, media_type="application/json")
+
+
+@app.get("/")
+async def root():
+    return _timestamped_response(_ROOT_BODY_PREFIX)
+
+
+@app.get("/api/health")
+async def health_check():
+    return _timestamped_response(_HEALTH_BODY_PREFIX or _build_health_prefix())
 
 
 # ============================================
@@ -374,7 +593,7 @@ async def admin_login(request: AuthRequest):
         return {
             "success": True,
             "message": "로그인 성공",
-            "token": "admin_session_" + str(int(datetime.utcnow().timestamp())),
+            "token": f"admin_session_{int(time.time())}",
             "role": "admin"
         }
     else:
@@ -559,8 +778,43 @@ async def upload_image_base64(data: dict):
 # AI Director & Chat
 # ============================================
 
-@app.post("/api/chat", response_model=ChatResponse)
-async def chat_with_director(request: ChatRequest):
+# 채팅 요청은 가장 잦은 경로 → FastAPI 의존성 주입 대신 orjson + TypeAdapter로 직접 검증
+_CHAT_ADAPTER = TypeAdapter(ChatRequest)
+_CHAT_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": ChatRequest.model_json_schema()}}
+    }
+}
+
+
+async def _parse_chat_request(http_request: Request) -> ChatRequest:
+    """요청 본문 → ChatRequest (오류 시 FastAPI와 동일한 422 응답)"""
+    body = await http_request.body()
+    try:
+        return _CHAT_ADAPTER.validate_python(orjson.loads(body))
+    except orjson.JSONDecodeError as e:
+        raise RequestValidationError([{
+            "type": "json_invalid",
+            "loc": ("body", e.pos),
+            "msg": "JSON decode error",
+            "input": {},
+            "ctx": {"error": e.msg}
+        }])
+    except ValidationError as e:
+        raise RequestValidationError([
+            {**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)
+        ])
+
+
+@app.post(
+    "/api/chat",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": ChatResponse}},
+    openapi_extra=_CHAT_OPENAPI
+)
+async def chat_with_director(http_request: Request):
     """
     AI Director와 대화
     - 의도 분석
@@ -568,66 +822,118 @@ async def chat_with_director(request: ChatRequest):
     - 프롬프트 최적화
     """
     
-    session_id = request.session_id or f"session_{int(datetime.utcnow().timestamp())}"
+    request = await _parse_chat_request(http_request)
+    session_id = request.session_id or f"session_{token_urlsafe(12)}"
     
     try:
         # AI Director 분석
         analysis = await director.analyze_intent(request.message, request.context)
-        decision = analysis.final_decision
-        
-        # 응답 메시지 생성
-        tool_name = decision.primary_tool.value.upper()
-        response_message = f"분석 완료! {tool_name}을 사용하여 영상을 생성하겠습니다.\n\n"
-        response_message += f"📌 판단 근거: {decision.reasoning}\n"
-        response_message += f"🎯 신뢰도: {decision.confidence:.0%}\n"
-        
-        if decision.secondary_tool:
-            response_message += f"🔄 보조 툴: {decision.secondary_tool.value.upper()}\n"
-        
-        # 액션 카드 생성
-        action_cards = [
-            {
-                "type": "video_generate",
-                "title": f"{tool_name} 영상 생성",
-                "description": decision.optimized_prompt[:100] + "...",
-                "params": {
-                    "model": decision.primary_tool.value,
-                    "prompt": decision.optimized_prompt,
-                    "style_preset": "warm_film"
-                }
-            }
-        ]
-        
-        # 제안 목록
-        suggestions = [
-            "스타일 변경",
-            "프롬프트 수정",
-            "다른 모델 사용",
-            "BGM 추가"
-        ]
-        
-        return ChatResponse(
-            message=response_message,
-            action_cards=action_cards,
-            suggestions=suggestions,
-            session_id=session_id,
-            action_type="tool_recommendation",
-            routing_decision={
-                "intent": decision.intent.value,
-                "primary_tool": decision.primary_tool.value,
-                "secondary_tool": decision.secondary_tool.value if decision.secondary_tool else None,
-                "confidence": decision.confidence,
-                "optimized_prompt": decision.optimized_prompt
-            }
-        )
+        return ORJSONResponse(_build_chat_payload(analysis, session_id))
         
     except Exception as e:
         print(f"❌ [Chat Error] {e}")
-        return ChatResponse(
-            message=f"죄송합니다, 처리 중 오류가 발생했습니다: {str(e)}",
-            session_id=session_id,
-            action_type="error"
-        )
+        return ORJSONResponse({
+            "message": f"죄송합니다, 처리 중 오류가 발생했습니다: {str(e)}",
+            "action_cards": [],
+            "suggestions": [],
+            "session_id": session_id,
+            "action_type": "error",
+            "routing_decision": None
+        })
+
+
+def _build_chat_payload(analysis, session_id: str) -> Dict[str, Any]:
+    """Director 분석 결과 → ChatResponse 필드"""
+    decision = analysis.final_decision
+    
+    # 응답 메시지 생성
+    tool_name = decision.primary_tool.value.upper()
+    response_message = f"분석 완료! {tool_name}을 사용하여 영상을 생성하겠습니다.\n\n"
+    response_message += f"📌 판단 근거: {decision.reasoning}\n"
+    response_message += f"🎯 신뢰도: {decision.confidence:.0%}\n"
+    
+    if decision.secondary_tool:
+        response_message += f"🔄 보조 툴: {decision.secondary_tool.value.upper()}\n"
+    
+    # 액션 카드 생성
+    action_cards = [
+        {
+            "type": "video_generate",
+            "title": f"{tool_name} 영상 생성",
+            "description": decision.optimized_prompt[:100] + "...",
+            "params": {
+                "model": decision.primary_tool.value,
+                "prompt": decision.optimized_prompt,
+                "style_preset": "warm_film"
+            }
+        }
+    ]
+    
+    # 제안 목록
+    suggestions = [
+        "스타일 변경",
+        "프롬프트 수정",
+        "다른 모델 사용",
+        "BGM 추가"
+    ]
+    
+    return {
+        "message": response_message,
+        "action_cards": action_cards,
+        "suggestions": suggestions,
+        "session_id": session_id,
+        "action_type": "tool_recommendation",
+        "routing_decision": {
+            "intent": decision.intent.value,
+            "primary_tool": decision.primary_tool.value,
+            "secondary_tool": decision.secondary_tool.value if decision.secondary_tool else None,
+            "confidence": decision.confidence,
+            "optimized_prompt": decision.optimized_prompt
+        }
+    }
+
+
+def _sse_event(event: str, data: Dict[str, Any]) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+@app.post("/api/chat/stream", openapi_extra=_CHAT_OPENAPI)
+async def chat_with_director_stream(http_request: Request):
+    """
+    AI Director와 대화 (SSE 스트리밍)
+    
+    - preview: 키워드 분석 결과 (Gemini 대기 없이 즉시)
+    - result: Gemini 분석까지 반영한 최종 결과 (/api/chat 응답과 동일한 형식)
+    - error: 처리 중 오류
+    """
+    
+    request = await _parse_chat_request(http_request)
+    session_id = request.session_id or f"session_{token_urlsafe(12)}"
+    
+    async def event_stream():
+        try:
+            preview = await director.analyze_intent(request.message, request.context, use_gemini=False)
+            yield _sse_event("preview", _build_chat_payload(preview, session_id))
+            
+            if director.model:
+                analysis = await director.analyze_intent(request.message, request.context)
+                yield _sse_event("result", _build_chat_payload(analysis, session_id))
+            else:
+                yield _sse_event("result", _build_chat_payload(preview, session_id))
+                
+        except Exception as e:
+            print(f"❌ [Chat Stream Error] {e}")
+            yield _sse_event("error", {
+                "message": f"죄송합니다, 처리 중 오류가 발생했습니다: {str(e)}",
+                "session_id": session_id,
+                "action_type": "error"
+            })
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @app.post("/api/director/analyze")
@@ -659,8 +965,13 @@ async def analyze_with_director(request: ChatRequest):
 # Video Generation (Smart Routing)
 # ============================================
 
-@app.post("/api/video/generate", response_model=VideoStatusResponse)
-async def generate_video(request: VideoGenerateRequest, background_tasks: BackgroundTasks):
+@app.post(
+    "/api/video/generate",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": VideoStatusResponse}}
+)
+async def generate_video(request: VideoGenerateRequest):
     """
     스마트 영상 생성 API
     - use_director=True: AI Director가 최적 모델 자동 선택
@@ -690,26 +1001,10 @@ async def generate_video(request: VideoGenerateRequest, background_tasks: Backgr
         print(f"🎯 [Director] 선택된 모델: {selected_model} (신뢰도: {decision.confidence:.0%})")
     
     # 모델 변환
-    model_map = {
-        "kling": VideoModel.KLING,
-        "veo": VideoModel.VEO,
-        "sora": VideoModel.SORA,
-        "hailuo": VideoModel.HAILUO,
-        "luma": VideoModel.LUMA,
-        "auto": VideoModel.KLING
-    }
-    
-    video_model = model_map.get(selected_model.lower(), VideoModel.KLING)
+    video_model = VIDEO_MODEL_MAP.get(selected_model.lower(), VideoModel.KLING)
     
     # 비율 변환
-    ratio_map = {
-        "16:9": AspectRatio.LANDSCAPE,
-        "9:16": AspectRatio.PORTRAIT,
-        "1:1": AspectRatio.SQUARE,
-        "4:5": AspectRatio.VERTICAL_FEED,
-    }
-    
-    aspect_ratio = ratio_map.get(request.aspect_ratio, AspectRatio.PORTRAIT)
+    aspect_ratio = VIDEO_RATIO_MAP.get(request.aspect_ratio, AspectRatio.PORTRAIT)
     
     # 소스 이미지 URL 처리 (source_image_url 우선, image_url 폴백)
     source_image = request.source_image_url or request.image_url
@@ -761,37 +1056,90 @@ async def generate_video(request: VideoGenerateRequest, background_tasks: Backgr
         raise HTTPException(status_code=500, detail="영상 생성 실패: task_id 없음")
     
     # Task 저장
-    task_store[request.project_id] = {
+    await task_store.set(request.project_id, {
+        "task_type": "video",
         "task_id": result.task_id,
-        "model": video_model,
+        "model": video_model.value,
         "status": "processing",
         "progress": 10,
         "video_url": None,
         "error_message": None,
         "routing_info": routing_info,
         "created_at": datetime.utcnow().isoformat()
-    }
+    })
     
     # 백그라운드 폴링
-    background_tasks.add_task(
-        poll_video_status, 
-        request.project_id, 
-        result.task_id, 
-        video_model
-    )
+    poller_pool.submit(poll_video_status, request.project_id, result.task_id, video_model)
     
     print(f"✅ [GENERATE SUCCESS] task_id: {result.task_id}")
     
-    return VideoStatusResponse(
-        success=True,
-        project_id=request.project_id,
-        task_id=result.task_id,
-        status="processing",
-        progress=10,
-        message=f"{video_model.value.upper()} 영상 생성이 시작되었습니다.",
-        model=video_model.value,
-        routing_info=routing_info
-    )
+    # 응답 값은 모두 서버에서 만든 값 → 모델 생성/재검증 없이 직렬화 (스키마: VideoStatusResponse)
+    return ORJSONResponse({
+        "success": True,
+        "project_id": request.project_id,
+        "task_id": result.task_id,
+        "status": "processing",
+        "progress": 10,
+        "message": f"{video_model.value.upper()} 영상 생성이 시작되었습니다.",
+        "video_url": None,
+        "model": video_model.value,
+        "routing_info": routing_info
+    })
+
+
+async def poll_ticks(max_attempts: int, poll_interval: float):
+    """
+    폴링 tick 생성 (attempt 번호)
+    
+    - tick 시각을 시작 시점 기준으로 고정 → 상태 조회에 걸린 시간만큼 다음 대기를 줄임
+    - 느린 벤더 응답이 폴링 주기에 더해지지 않고, 경과 시간 = (attempt + 1) * poll_interval
+    """
+    start = time.monotonic()
+    for attempt in range(max_attempts):
+        delay = start + (attempt + 1) * poll_interval - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        yield attempt
+
+
+# 벤더 진행률은 이 값 이상 변했을 때만 저장
+PROGRESS_WRITE_STEP = 5
+
+
+def _is_material_change(
+    last: Optional[Dict[str, Any]],
+    update: Dict[str, Any],
+    progress_step: int = PROGRESS_WRITE_STEP
+) -> bool:
+    """이전 저장 이후 바뀐 것이 있는지 판별 (상태/URL/메시지 변경, 진행률 progress_step 이상 변화만 저장)"""
+    if last is None:
+        return True
+
+    for key, value in update.items():
+        if key == "progress":
+            if abs(value - last.get("progress", 0)) >= progress_step:
+                return True
+        elif last.get(key) != value:
+            return True
+
+    return False
+
+
+def _processing_message(task_data: Dict[str, Any], default: str) -> str:
+    """
+    진행 중 메시지 - 경과 시간은 조회 시점에 created_at 기준으로 계산
+    (폴러가 매 tick 저장하지 않아도 진행률이 고정된 벤더에서 메시지가 멈추지 않음)
+    """
+    message = task_data.get("message")
+    if message:
+        return message
+
+    created_at = task_data.get("created_at")
+    if not created_at or task_data.get("status") in ["completed", "succeed", "failed"]:
+        return default
+
+    elapsed = (datetime.utcnow() - datetime.fromisoformat(created_at)).total_seconds()
+    return f"생성 중... ({max(0, int(elapsed))}초 경과)"
 
 
 async def poll_video_status(project_id: str, task_id: str, model: VideoModel):
@@ -799,59 +1147,144 @@ async def poll_video_status(project_id: str, task_id: str, model: VideoModel):
     max_attempts = 200  # 최대 10분 (3초 * 200)
     poll_interval = 3
     
-    for attempt in range(max_attempts):
-        await asyncio.sleep(poll_interval)
-        
-        result = await factory.check_video_status(task_id, model)
-        
-        if project_id in task_store:
-            task_store[project_id]["status"] = result.status
-            task_store[project_id]["progress"] = result.progress
-            task_store[project_id]["video_url"] = result.video_url
-            
-            elapsed = (attempt + 1) * poll_interval
-            task_store[project_id]["message"] = f"생성 중... ({elapsed}초 경과)"
-            
-            if result.status == "completed" and result.video_url:
-                task_store[project_id]["message"] = "영상 생성 완료!"
-                print(f"✅ 영상 생성 완료: {project_id} (URL: {result.video_url})")
-                break
-            elif result.status == "failed":
-                error_msg = result.message or "영상 생성 실패"
-                task_store[project_id]["error_message"] = error_msg
-                task_store[project_id]["message"] = f"❌ {error_msg}"
-                print(f"❌ 영상 생성 실패: {project_id} - {error_msg}")
-                break
+    last_written: Optional[Dict[str, Any]] = None
+    
+    async for _ in poll_ticks(max_attempts, poll_interval):
+        async with poller_pool.checks:
+            result = await factory.check_video_status(task_id, model)
 
+        # 진행 중 메시지(경과 시간)는 저장하지 않음 - 조회 시 _processing_message로 생성
+        update = {
+            "status": result.status,
+            "progress": result.progress,
+            "video_url": result.video_url
+        }
 
-@app.get("/api/video/progress/{project_id}", response_model=VideoStatusResponse)
-async def get_video_progress(project_id: str):
-    """영상 생성 진행률 조회"""
+        if result.status == "completed" and result.video_url:
+            update["message"] = "영상 생성 완료!"
+            await task_writer.put(project_id, update)
+            print(f"✅ 영상 생성 완료: {project_id} (URL: {result.video_url})")
+            break
+        elif result.status == "failed":
+            error_msg = result.message or "영상 생성 실패"
+            update["error_message"] = error_msg
+            update["message"] = f"❌ {error_msg}"
+            await task_writer.put(project_id, update)
+            print(f"❌ 영상 생성 실패: {project_id} - {error_msg}")
+            break
+
+        # 상태/진행률이 그대로인 tick은 저장/알림 생략
+        if _is_material_change(last_written, update):
+            await task_writer.put(project_id, update)
+            last_written = update
+
+
+# 롱폴링 최대 대기 시간 (프록시 idle timeout보다 짧게)
+LONG_POLL_MAX_WAIT = 25.0
+
+
+@app.get(
+    "/api/video/progress/{project_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": VideoStatusResponse}}
+)
+async def get_video_progress(project_id: str, wait: float = 0, last_progress: Optional[int] = None):
+    """
+    영상 생성 진행률 조회
     
-    task_data = task_store.get(project_id)
+    - wait=N&last_progress=P: 진행률이 아직 P면 바뀔 때까지 최대 N초 대기 (롱폴링)
+    - 진행률이 그대로인 알림은 넘기고 계속 대기, timeout 시 현재 상태 그대로 200
+    """
     
+    # 조회 전에 알림 버전을 받아 둠 (조회 직후의 변경도 놓치지 않도록)
+    version = task_store.version(project_id)
+    task_data = await task_store.get(project_id)
+
     if not task_data:
         raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
     
-    return VideoStatusResponse(
-        success=True,
-        project_id=project_id,
-        task_id=task_data.get("task_id"),
-        status=task_data.get("status", "processing"),
-        progress=task_data.get("progress", 0),
-        message=task_data.get("message", "처리 중..."),
-        video_url=task_data.get("video_url"),
-        model=str(task_data.get("model", "")),
-        routing_info=task_data.get("routing_info")
-    )
+    if wait > 0 and last_progress is not None:
+        deadline = time.monotonic() + min(wait, LONG_POLL_MAX_WAIT)
+        while (
+            task_data.get("progress", 0) == last_progress
+            and task_data.get("status") not in ["completed", "failed"]
+            and (remaining := deadline - time.monotonic()) > 0
+            and await task_store.wait_for_update(project_id, remaining, since=version)
+        ):
+            version = task_store.version(project_id)
+            task_data = await task_store.get(project_id) or task_data
+    
+    # 폴링 hot path - Pydantic 모델/jsonable_encoder 없이 orjson으로 바로 직렬화 (스키마: VideoStatusResponse)
+    return ORJSONResponse(_video_progress_payload(project_id, task_data))
+
+
+def _video_progress_payload(project_id: str, task_data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "success": True,
+        "project_id": project_id,
+        "task_id": task_data.get("task_id"),
+        "status": task_data.get("status", "processing"),
+        "progress": task_data.get("progress", 0),
+        "message": _processing_message(task_data, "처리 중..."),
+        "video_url": task_data.get("video_url"),
+        "model": str(task_data.get("model", "")),
+        "routing_info": task_data.get("routing_info")
+    }
+
+
+@app.websocket("/ws/video/progress/{project_id}")
+async def video_progress_ws(websocket: WebSocket, project_id: str):
+    """
+    영상 생성 진행률 WebSocket
+    
+    - 연결 직후 현재 상태 1회, 이후 task_store 변경 알림마다 바뀐 상태만 전송 (형식: /api/video/progress)
+    - completed/failed 전송 후 서버가 연결 종료
+    - 작업이 없으면 4404로 종료
+    """
+    await websocket.accept()
+    
+    version = task_store.version(project_id)
+    task_data = await task_store.get(project_id)
+    if not task_data:
+        await websocket.close(code=4404, reason="project not found")
+        return
+    
+    last_sent = None
+    try:
+        while True:
+            payload = _video_progress_payload(project_id, task_data)
+            if payload != last_sent:
+                await websocket.send_text(orjson.dumps(payload).decode())
+                last_sent = payload
+            
+            if payload["status"] in ["completed", "failed"]:
+                break
+            
+            # timeout이어도 다시 조회 - 작업이 만료되면 종료 (끊긴 연결이 무한 대기하지 않도록)
+            await task_store.wait_for_update(project_id, LONG_POLL_MAX_WAIT, since=version)
+            version = task_store.version(project_id)
+            task_data = await task_store.get(project_id)
+            if not task_data:
+                await websocket.close(code=4404, reason="project not found")
+                return
+        
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
 
 
 # ============================================
 # Image Generation API
 # ============================================
 
-@app.post("/api/image/generate", response_model=ImageStatusResponse)
-async def generate_image(request: ImageGenerateRequest, background_tasks: BackgroundTasks):
+@app.post(
+    "/api/image/generate",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": ImageStatusResponse}}
+)
+async def generate_image(request: ImageGenerateRequest):
     """
     이미지 생성 API
     
@@ -861,25 +1294,11 @@ async def generate_image(request: ImageGenerateRequest, background_tasks: Backgr
     생성된 이미지는 타임라인의 Overlay 트랙에 사용 가능
     """
     
-    # 모델 변환 (gemini가 기본값)
-    model_map = {
-        "gemini": ImageModel.GEMINI,  # 기본값 - 비용 효율적
-        "flux": ImageModel.FLUX,
-        "midjourney": ImageModel.MIDJOURNEY,
-        "dalle": ImageModel.DALLE,
-    }
-    
-    # 기본 모델을 Gemini로 설정 (비용 효율적)
-    image_model = model_map.get(request.model.lower(), ImageModel.GEMINI)
+    # 모델 변환 - 기본 모델을 Gemini로 설정 (비용 효율적)
+    image_model = IMAGE_MODEL_MAP.get(request.model.lower(), ImageModel.GEMINI)
     
     # 비율 변환
-    ratio_map = {
-        "16:9": AspectRatio.LANDSCAPE,
-        "9:16": AspectRatio.PORTRAIT,
-        "1:1": AspectRatio.SQUARE,
-    }
-    
-    aspect_ratio = ratio_map.get(request.aspect_ratio, AspectRatio.PORTRAIT)
+    aspect_ratio = RATIO_MAP.get(request.aspect_ratio, AspectRatio.PORTRAIT)
     
     # ImageRequest 생성
     image_request = ImageRequest(
@@ -901,27 +1320,31 @@ async def generate_image(request: ImageGenerateRequest, background_tasks: Backgr
         raise HTTPException(status_code=500, detail=f"이미지 생성 실패: {result.message}")
     
     # Task 저장
-    task_store[f"image_{request.project_id}"] = {
+    await task_store.set(f"image_{request.project_id}", {
+        "task_type": "image",
         "task_id": result.task_id,
         "model": image_model.value,
         "status": "processing",
         "progress": 10,
         "image_url": None,
         "created_at": datetime.utcnow().isoformat()
-    }
+    })
     
     # 백그라운드 폴링
-    background_tasks.add_task(poll_image_status, request.project_id, result.task_id)
+    poller_pool.submit(poll_image_status, request.project_id, result.task_id)
     
-    return ImageStatusResponse(
-        success=True,
-        project_id=request.project_id,
-        task_id=result.task_id,
-        status="processing",
-        progress=10,
-        message=f"{image_model.value.upper()} 이미지 생성이 시작되었습니다.",
-        model=image_model.value
-    )
+    # 응답 값은 모두 서버에서 만든 값 → 모델 생성/재검증 없이 직렬화 (스키마: ImageStatusResponse)
+    return ORJSONResponse({
+        "success": True,
+        "project_id": request.project_id,
+        "task_id": result.task_id,
+        "status": "processing",
+        "progress": 10,
+        "message": f"{image_model.value.upper()} 이미지 생성이 시작되었습니다.",
+        "image_url": None,
+        "model": image_model.value,
+        "template_id": None
+    })
 
 
 async def poll_image_status(project_id: str, task_id: str):
@@ -929,51 +1352,64 @@ async def poll_image_status(project_id: str, task_id: str):
     max_attempts = 60
     poll_interval = 3
     
-    for attempt in range(max_attempts):
-        await asyncio.sleep(poll_interval)
-        
-        result = await factory.goapi.check_image_status(task_id)
-        
-        store_key = f"image_{project_id}"
-        if store_key in task_store:
-            task_store[store_key]["status"] = result.status
-            task_store[store_key]["image_url"] = result.image_url
-            
-            elapsed = (attempt + 1) * poll_interval
-            
-            if result.status == "completed" and result.image_url:
-                task_store[store_key]["progress"] = 100
-                task_store[store_key]["message"] = "이미지 생성 완료!"
-                print(f"✅ 이미지 생성 완료: {project_id}")
-                break
-            elif result.status == "failed":
-                task_store[store_key]["progress"] = 0
-                task_store[store_key]["message"] = f"실패: {result.message}"
-                break
-            else:
-                task_store[store_key]["progress"] = min(90, 10 + attempt * 3)
+    last_written: Optional[Dict[str, Any]] = None
+    
+    async for attempt in poll_ticks(max_attempts, poll_interval):
+        async with poller_pool.checks:
+            result = await factory.goapi.check_image_status(task_id)
 
+        store_key = f"image_{project_id}"
+        update = {
+            "status": result.status,
+            "image_url": result.image_url
+        }
 
-@app.get("/api/image/progress/{project_id}", response_model=ImageStatusResponse)
+        if result.status == "completed" and result.image_url:
+            update["progress"] = 100
+            update["message"] = "이미지 생성 완료!"
+            await task_writer.put(store_key, update)
+            print(f"✅ 이미지 생성 완료: {project_id}")
+            break
+        elif result.status == "failed":
+            update["progress"] = 0
+            update["message"] = f"실패: {result.message}"
+            await task_writer.put(store_key, update)
+            break
+
+        # 추정 진행률은 tick마다 바뀌므로 변화 폭과 무관하게 저장 (90% 도달 후부터 생략)
+        update["progress"] = min(90, 10 + attempt * 3)
+        if _is_material_change(last_written, update, progress_step=1):
+            await task_writer.put(store_key, update)
+            last_written = update
+
+
+@app.get(
+    "/api/image/progress/{project_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": ImageStatusResponse}}
+)
 async def get_image_progress(project_id: str):
     """이미지 생성 진행률 조회"""
     
     store_key = f"image_{project_id}"
-    task_data = task_store.get(store_key)
+    task_data = await task_store.get(store_key)
     
     if not task_data:
         raise HTTPException(status_code=404, detail="이미지 작업을 찾을 수 없습니다.")
     
-    return ImageStatusResponse(
-        success=True,
-        project_id=project_id,
-        task_id=task_data.get("task_id"),
-        status=task_data.get("status", "processing"),
-        progress=task_data.get("progress", 0),
-        message=task_data.get("message", "처리 중..."),
-        image_url=task_data.get("image_url"),
-        model=task_data.get("model", "")
-    )
+    # 폴링 hot path - Pydantic 모델/jsonable_encoder 없이 orjson으로 바로 직렬화 (스키마: ImageStatusResponse)
+    return ORJSONResponse({
+        "success": True,
+        "project_id": project_id,
+        "task_id": task_data.get("task_id"),
+        "status": task_data.get("status", "processing"),
+        "progress": task_data.get("progress", 0),
+        "message": task_data.get("message", "처리 중..."),
+        "image_url": task_data.get("image_url"),
+        "model": task_data.get("model", ""),
+        "template_id": None
+    })
 
 
 # ============================================
@@ -999,33 +1435,62 @@ class FactoryStatusResponse(BaseModel):
     completed_at: Optional[str] = None
 
 
-@app.get("/api/factory/status/{task_id}", response_model=FactoryStatusResponse)
-async def get_factory_status(task_id: str):
+class FactoryStatusStruct(msgspec.Struct):
+    """
+    FactoryStatusResponse와 동일한 필드의 msgspec 버전
+    3초 간격 폴링 경로에서 Pydantic 검증/인코딩을 건너뛰기 위해 사용
+    """
+    success: bool
+    task_id: str
+    task_type: str
+    status: str
+    progress: int
+    message: str
+    video_url: Optional[str] = None
+    audio_url: Optional[str] = None
+    thumbnail_url: Optional[str] = None
+    model: Optional[str] = None
+    duration: Optional[float] = None
+    created_at: Optional[str] = None
+    completed_at: Optional[str] = None
+
+
+def _normalize_task_status(task_data: Dict[str, Any]):
+    """상태 정규화 (succeed/success → completed) → (status, progress)"""
+    status = task_data.get("status", "processing")
+    progress = task_data.get("progress", 0)
+    
+    # completed 상태 정규화
+    if status in ["succeed", "success"]:
+        status = "completed"
+        progress = 100
+    
+    return status, progress
+
+
+def _task_status_etag(task_data: Dict[str, Any], task_id: str, status: str, progress: int) -> str:
+    return f'W/"{task_data.get("task_id", task_id)}-{status}-{progress}"'
+
+
+@app.get(
+    "/api/factory/status/{task_id}",
+    response_model=None,
+    responses={200: {"model": FactoryStatusResponse}}
+)
+async def get_factory_status(task_id: str, request: Request, wait: float = 0):
     """
     🏭 통합 작업 상태 조회 API
     
     - 모든 작업(video, music, avatar, edit) 상태를 하나의 엔드포인트로 조회
     - 프론트엔드에서 3초 간격으로 폴링하여 사용
     - 상태가 completed가 되면 결과물 URL 반환
+    - ETag(task_id-status-progress) 일치 시 304 (본문 직렬화 생략)
+      (메시지는 저장된 값만 사용 - 경과 시간 문구를 넣으면 ETag가 같아도 본문이 달라짐)
+    - wait=N (초): ETag가 최신이면 변경 알림까지 최대 N초 대기 (롱폴링)
     """
     
-    # 1. project_id로 저장된 task 찾기 (task_id가 project_id인 경우)
-    task_data = task_store.get(task_id)
-    task_type = "video"
-    
-    # 2. task_id로 직접 찾기
-    if not task_data:
-        for key, data in task_store.items():
-            if data.get("task_id") == task_id:
-                task_data = data
-                # task type 판별
-                if key.startswith("music_"):
-                    task_type = "music"
-                elif key.startswith("edit_"):
-                    task_type = "edit"
-                elif data.get("model") == "heygen":
-                    task_type = "avatar"
-                break
+    # 1. project_id로 저장된 task 또는 2. 벤더 task_id (역인덱스) - 한 번에 조회
+    store_key, task_data = await task_store.lookup(task_id)
     
     # 3. 찾지 못한 경우
     if not task_data:
@@ -1034,14 +1499,41 @@ async def get_factory_status(task_id: str):
             detail=f"작업을 찾을 수 없습니다: {task_id}"
         )
     
-    # 상태 정규화
-    status = task_data.get("status", "processing")
-    progress = task_data.get("progress", 0)
+    status, progress = _normalize_task_status(task_data)
+    etag = _task_status_etag(task_data, task_id, status, progress)
+    
+    # 롱폴링: 클라이언트가 이미 최신 상태면 task_store 변경 알림(pub/sub)까지 대기
+    # - 저장 key는 조회 후에야 확정되므로 버전을 받은 뒤 한 번 더 조회 (그 사이 변경 유실 방지)
+    if_none_match = request.headers.get("if-none-match")
+    if wait > 0 and status not in ["completed", "failed"] and if_none_match == etag:
+        deadline = time.monotonic() + min(wait, LONG_POLL_MAX_WAIT)
+        while True:
+            version = task_store.version(store_key)
+            task_data = await task_store.get(store_key) or task_data
+            status, progress = _normalize_task_status(task_data)
+            etag = _task_status_etag(task_data, task_id, status, progress)
+            if (
+                status in ["completed", "failed"]
+                or etag != if_none_match
+                or (remaining := deadline - time.monotonic()) <= 0
+                or not await task_store.wait_for_update(store_key, remaining, since=version)
+            ):
+                break
     
-    # completed 상태 정규화
-    if status in ["succeed", "success"]:
-        status = "completed"
-        progress = 100
+    # task type은 작업 생성 시 저장됨
+    task_type = task_data.get("task_type", "video")
+    
+    # 상태/진행률이 그대로면 304
+    # - 벤더 task_id로 조회한 완료 작업만 불변 → 브라우저 캐시에서 처리
+    # - project_id로 조회한 경우 같은 id로 새 생성이 시작될 수 있으므로 매번 ETag 재검증
+    headers = {"ETag": etag}
+    if status == "completed" and store_key != task_id:
+        headers["Cache-Control"] = "public, max-age=86400, immutable"
+    else:
+        headers["Cache-Control"] = "private, no-cache"
+    
+    if if_none_match == etag:
+        return Response(status_code=304, headers=headers)
     
     # 결과물 URL 추출
     video_url = task_data.get("video_url")
@@ -1052,7 +1544,7 @@ async def get_factory_status(task_id: str):
     if status == "completed":
         completed_at = datetime.utcnow().isoformat()
     
-    return FactoryStatusResponse(
+    payload = FactoryStatusStruct(
         success=True,
         task_id=task_data.get("task_id", task_id),
         task_type=task_type,
@@ -1067,9 +1559,19 @@ async def get_factory_status(task_id: str):
         created_at=task_data.get("created_at"),
         completed_at=completed_at
     )
+    
+    return Response(content=msgspec.json.encode(payload), media_type="application/json", headers=headers)
+
+
+# 프로젝트 작업 종류: (저장 key prefix, type, 결과 URL 필드, 고정 model 표기)
+PROJECT_TASK_KINDS = (
+    ("", "video", "video_url", None),
+    ("music_", "music", "audio_url", "suno"),
+    ("edit_", "edit", "video_url", "creatomate"),
+)
 
 
-@app.get("/api/factory/status/project/{project_id}")
+@app.get("/api/factory/status/project/{project_id}", response_class=ORJSONResponse)
 async def get_factory_status_by_project(project_id: str):
     """
     프로젝트 ID로 모든 관련 작업 상태 조회
@@ -1081,46 +1583,142 @@ async def get_factory_status_by_project(project_id: str):
         "tasks": []
     }
     
-    # 비디오 작업
-    video_task = task_store.get(project_id)
-    if video_task:
-        results["tasks"].append({
-            "type": "video",
-            "task_id": video_task.get("task_id"),
-            "status": video_task.get("status"),
-            "progress": video_task.get("progress"),
-            "video_url": video_task.get("video_url"),
-            "model": str(video_task.get("model", ""))
-        })
-    
-    # 음악 작업
-    music_task = task_store.get(f"music_{project_id}")
-    if music_task:
-        results["tasks"].append({
-            "type": "music",
-            "task_id": music_task.get("task_id"),
-            "status": music_task.get("status"),
-            "progress": music_task.get("progress"),
-            "audio_url": music_task.get("audio_url"),
-            "model": "suno"
-        })
-    
-    # 편집 작업
-    edit_task = task_store.get(f"edit_{project_id}")
-    if edit_task:
-        results["tasks"].append({
-            "type": "edit",
-            "task_id": edit_task.get("task_id"),
-            "status": edit_task.get("status"),
-            "progress": edit_task.get("progress"),
-            "video_url": edit_task.get("video_url"),
-            "model": "creatomate"
-        })
+    # 비디오/음악/편집 작업을 한 번에 조회 (Redis: 1회 왕복)
+    tasks = await task_store.get_many([
+        f"{key_prefix}{project_id}" for key_prefix, *_ in PROJECT_TASK_KINDS
+    ])
+    
+    for (_, task_type, url_field, fixed_model), task in zip(PROJECT_TASK_KINDS, tasks):
+        if task:
+            results["tasks"].append({
+                "type": task_type,
+                "task_id": task.get("task_id"),
+                "status": task.get("status"),
+                "progress": task.get("progress"),
+                url_field: task.get(url_field),
+                "model": fixed_model or str(task.get("model", ""))
+            })
     
     if not results["tasks"]:
         raise HTTPException(status_code=404, detail="프로젝트에 작업이 없습니다.")
     
-    return results
+    return ORJSONResponse(results)
+
+
+# ============================================
+# Vendor Task Polling (아바타/편집/음악 공용)
+# ============================================
+
+@dataclass
+class VendorSpec:
+    """
+    벤더 작업 폴링 설정
+
+    - check: (task_id, attempt) → task_store patch (일시 오류 시 None)
+    - 벤더마다 다른 것은 상태 조회 함수와 저장 키 prefix 뿐
+    """
+    name: str
+    key_prefix: str
+    check: Callable[[str, int], Awaitable[Optional[Dict[str, Any]]]]
+    max_attempts: int = 60
+    poll_interval: float = 5
+    done_statuses: tuple = ("completed", "failed")
+
+
+async def poll_vendor_task(spec: VendorSpec, project_id: str, task_id: str):
+    """벤더 작업 상태 폴링 - 완료/실패 또는 max_attempts까지"""
+    store_key = f"{spec.key_prefix}{project_id}"
+    last_written: Optional[Dict[str, Any]] = None
+
+    async for attempt in poll_ticks(spec.max_attempts, spec.poll_interval):
+        try:
+            async with poller_pool.checks:
+                update = await spec.check(task_id, attempt)
+        except Exception as e:
+            print(f"⚠️ [{spec.name}] 폴링 오류: {e}")
+            continue
+
+        if update is None:
+            continue
+
+        done = update["status"] in spec.done_statuses
+        if done or _is_material_change(last_written, update):
+            await task_writer.put(store_key, update)
+            last_written = update
+
+        if done:
+            print(f"🏁 [{spec.name}] {store_key}: {update['status']}")
+            break
+
+
+async def _check_avatar_status(video_id: str, attempt: int) -> Dict[str, Any]:
+    result = await factory.heygen.check_status(video_id)
+    return {
+        "status": result.status,
+        "progress": result.progress,
+        "video_url": result.video_url
+    }
+
+
+async def _check_render_status(render_id: str, attempt: int) -> Dict[str, Any]:
+    result = await factory.creatomate.check_render_status(render_id)
+    return {
+        "status": result.status,
+        "progress": result.progress,
+        "video_url": result.video_url
+    }
+
+
+# GoAPI 작업 조회 - 폴링 tick마다 환경 변수/헤더를 다시 만들지 않도록 모듈 레벨 상수
+GOAPI_TASK_URL = "https://api.goapi.ai/api/v1/task/"
+_GOAPI_HEADERS = {
+    "x-api-key": os.getenv("GOAPI_KEY", "")
+}
+
+
+async def _check_music_status(task_id: str, attempt: int) -> Optional[Dict[str, Any]]:
+    """GoAPI Suno 작업 상태 조회"""
+    response = await app.state.http.get(GOAPI_TASK_URL + task_id, headers=_GOAPI_HEADERS)
+
+    if response.status_code != 200:
+        return None
+
+    data = response.json()
+    if data.get("code") != 200:
+        return None
+
+    task_data = data.get("data", {})
+    status = task_data.get("status", "processing")
+    output = task_data.get("output", {})
+
+    if status in ["completed", "succeed"]:
+        # 오디오 URL 추출
+        return {
+            "status": status,
+            "audio_url": output.get("audio_url") or output.get("url"),
+            "progress": 100
+        }
+    elif status == "failed":
+        return {"status": status, "progress": 0}
+
+    # 진행 중 메시지(경과 시간)는 저장하지 않음 - 조회 시 _processing_message로 생성
+    return {
+        "status": status,
+        "progress": min(90, 10 + attempt * 3)
+    }
+
+
+AVATAR_SPEC = VendorSpec(name="AVATAR", key_prefix="", check=_check_avatar_status, max_attempts=120)
+EDIT_SPEC = VendorSpec(name="EDIT", key_prefix="edit_", check=_check_render_status)
+CONCAT_SPEC = replace(EDIT_SPEC, name="CONCAT", key_prefix="concat_")
+MERGE_SPEC = replace(EDIT_SPEC, name="MERGE", key_prefix="merge_")
+TEXT_SPEC = replace(EDIT_SPEC, name="TEXT", key_prefix="text_")
+MUSIC_SPEC = VendorSpec(
+    name="MUSIC",
+    key_prefix="music_",
+    check=_check_music_status,
+    done_statuses=("completed", "succeed", "failed")
+)
 
 
 # ============================================
@@ -1128,20 +1726,14 @@ async def get_factory_status_by_project(project_id: str):
 # ============================================
 
 @app.post("/api/avatar/generate")
-async def generate_avatar(request: AvatarGenerateRequest, background_tasks: BackgroundTasks):
+async def generate_avatar(request: AvatarGenerateRequest):
     """HeyGen 아바타 영상 생성"""
     
-    ratio_map = {
-        "16:9": AspectRatio.LANDSCAPE,
-        "9:16": AspectRatio.PORTRAIT,
-        "1:1": AspectRatio.SQUARE,
-    }
-    
     avatar_request = AvatarRequest(
         script=request.script,
         avatar_id=request.avatar_id,
         voice_id=request.voice_id,
-        aspect_ratio=ratio_map.get(request.aspect_ratio, AspectRatio.PORTRAIT)
+        aspect_ratio=RATIO_MAP.get(request.aspect_ratio, AspectRatio.PORTRAIT)
     )
     
     result = await factory.create_avatar(avatar_request)
@@ -1150,17 +1742,18 @@ async def generate_avatar(request: AvatarGenerateRequest, background_tasks: Back
         raise HTTPException(status_code=500, detail=f"아바타 생성 실패: {result.message}")
     
     # Task 저장
-    task_store[request.project_id] = {
+    await task_store.set(request.project_id, {
+        "task_type": "avatar",
         "task_id": result.task_id,
         "model": "heygen",
         "status": "processing",
         "progress": 10,
         "video_url": None,
         "created_at": datetime.utcnow().isoformat()
-    }
+    })
     
     # 백그라운드 폴링
-    background_tasks.add_task(poll_avatar_status, request.project_id, result.task_id)
+    poller_pool.submit(poll_vendor_task, AVATAR_SPEC, request.project_id, result.task_id)
     
     return {
         "success": True,
@@ -1171,26 +1764,6 @@ async def generate_avatar(request: AvatarGenerateRequest, background_tasks: Back
     }
 
 
-async def poll_avatar_status(project_id: str, video_id: str):
-    """HeyGen 상태 폴링"""
-    max_attempts = 120
-    
-    for _ in range(max_attempts):
-        await asyncio.sleep(5)
-        
-        result = await factory.check_avatar_status(video_id)
-        
-        if project_id in task_store:
-            task_store[project_id]["status"] = result.status
-            task_store[project_id]["progress"] = result.progress
-            task_store[project_id]["video_url"] = result.video_url
-            
-            if result.status == "completed":
-                break
-            elif result.status == "failed":
-                break
-
-
 @app.get("/api/avatar/list")
 async def list_avatars():
     """사용 가능한 아바타 목록"""
@@ -1208,16 +1781,10 @@ async def list_avatars():
 # ============================================
 
 @app.post("/api/creatomate/auto-edit")
-async def auto_edit_video(request: EditVideoRequest, background_tasks: BackgroundTasks):
+async def auto_edit_video(request: EditVideoRequest):
     """Creatomate 자동 편집"""
     
-    ratio_map = {
-        "16:9": AspectRatio.LANDSCAPE,
-        "9:16": AspectRatio.PORTRAIT,
-        "1:1": AspectRatio.SQUARE,
-    }
-    
-    aspect_ratio = ratio_map.get(request.aspect_ratio, AspectRatio.PORTRAIT)
+    aspect_ratio = RATIO_MAP.get(request.aspect_ratio, AspectRatio.PORTRAIT)
     
     result = await factory.creatomate.auto_edit(
         project_id=request.project_id,
@@ -1232,18 +1799,19 @@ async def auto_edit_video(request: EditVideoRequest, background_tasks: Backgroun
         raise HTTPException(status_code=500, detail=f"편집 실패: {result.message}")
     
     # Task 저장 (video_url이 이미 있으면 저장)
-    task_store[f"edit_{request.project_id}"] = {
+    await task_store.set(f"edit_{request.project_id}", {
+        "task_type": "edit",
         "task_id": result.task_id,
         "model": "creatomate",
         "status": result.status,
         "progress": result.progress,
         "video_url": result.video_url,
         "created_at": datetime.utcnow().isoformat()
-    }
+    })
     
     # completed 상태가 아닐 때만 백그라운드 폴링
     if result.status != "completed":
-        background_tasks.add_task(poll_edit_status, request.project_id, result.task_id)
+        poller_pool.submit(poll_vendor_task, EDIT_SPEC, request.project_id, result.task_id)
     
     return {
         "success": True,
@@ -1256,25 +1824,6 @@ async def auto_edit_video(request: EditVideoRequest, background_tasks: Backgroun
     }
 
 
-async def poll_edit_status(project_id: str, render_id: str):
-    """Creatomate 렌더링 상태 폴링"""
-    max_attempts = 60
-    
-    for _ in range(max_attempts):
-        await asyncio.sleep(5)
-        
-        result = await factory.creatomate.check_render_status(render_id)
-        
-        store_key = f"edit_{project_id}"
-        if store_key in task_store:
-            task_store[store_key]["status"] = result.status
-            task_store[store_key]["progress"] = result.progress
-            task_store[store_key]["video_url"] = result.video_url
-            
-            if result.status in ["completed", "failed"]:
-                break
-
-
 # ============================================
 # Creatomate Video Merge/Concat API (NEW!)
 # ============================================
@@ -1308,7 +1857,7 @@ class TextOverlayRequest(BaseModel):
 
 
 @app.post("/api/creatomate/concat")
-async def concat_videos(request: ConcatVideosRequest, background_tasks: BackgroundTasks):
+async def concat_videos(request: ConcatVideosRequest):
     """
     🎬 여러 비디오 연결 (Concat)
     
@@ -1317,13 +1866,7 @@ async def concat_videos(request: ConcatVideosRequest, background_tasks: Backgrou
     - Creatomate API 사용
     """
     
-    ratio_map = {
-        "16:9": AspectRatio.LANDSCAPE,
-        "9:16": AspectRatio.PORTRAIT,
-        "1:1": AspectRatio.SQUARE,
-    }
-    
-    aspect_ratio = ratio_map.get(request.aspect_ratio, AspectRatio.PORTRAIT)
+    aspect_ratio = RATIO_MAP.get(request.aspect_ratio, AspectRatio.PORTRAIT)
     
     result = await factory.creatomate.concat_videos(
         project_id=request.project_id,
@@ -1337,18 +1880,19 @@ async def concat_videos(request: ConcatVideosRequest, background_tasks: Backgrou
         raise HTTPException(status_code=500, detail=f"비디오 연결 실패: {result.message}")
     
     # Task 저장
-    task_store[f"concat_{request.project_id}"] = {
+    await task_store.set(f"concat_{request.project_id}", {
+        "task_type": "edit",
         "task_id": result.task_id,
         "model": "creatomate_concat",
         "status": result.status,
         "progress": result.progress,
         "video_url": result.video_url,
         "created_at": datetime.utcnow().isoformat()
-    }
+    })
     
     # 백그라운드 폴링 (완료되지 않은 경우)
     if result.status != "completed":
-        background_tasks.add_task(poll_edit_status, request.project_id, result.task_id)
+        poller_pool.submit(poll_vendor_task, CONCAT_SPEC, request.project_id, result.task_id)
     
     return {
         "success": True,
@@ -1363,7 +1907,7 @@ async def concat_videos(request: ConcatVideosRequest, background_tasks: Backgrou
 
 
 @app.post("/api/creatomate/merge-with-music")
-async def merge_videos_with_music(request: MergeVideosWithMusicRequest, background_tasks: BackgroundTasks):
+async def merge_videos_with_music(request: MergeVideosWithMusicRequest):
     """
     🎬🎵 비디오들을 연결하고 배경 음악 추가
     
@@ -1372,13 +1916,7 @@ async def merge_videos_with_music(request: MergeVideosWithMusicRequest, backgrou
     - Creatomate API 사용
     """
     
-    ratio_map = {
-        "16:9": AspectRatio.LANDSCAPE,
-        "9:16": AspectRatio.PORTRAIT,
-        "1:1": AspectRatio.SQUARE,
-    }
-    
-    aspect_ratio = ratio_map.get(request.aspect_ratio, AspectRatio.PORTRAIT)
+    aspect_ratio = RATIO_MAP.get(request.aspect_ratio, AspectRatio.PORTRAIT)
     
     result = await factory.creatomate.merge_videos_with_music(
         project_id=request.project_id,
@@ -1394,17 +1932,18 @@ async def merge_videos_with_music(request: MergeVideosWithMusicRequest, backgrou
         raise HTTPException(status_code=500, detail=f"비디오+음악 병합 실패: {result.message}")
     
     # Task 저장
-    task_store[f"merge_{request.project_id}"] = {
+    await task_store.set(f"merge_{request.project_id}", {
+        "task_type": "edit",
         "task_id": result.task_id,
         "model": "creatomate_merge",
         "status": result.status,
         "progress": result.progress,
         "video_url": result.video_url,
         "created_at": datetime.utcnow().isoformat()
-    }
+    })
     
     if result.status != "completed":
-        background_tasks.add_task(poll_edit_status, request.project_id, result.task_id)
+        poller_pool.submit(poll_vendor_task, MERGE_SPEC, request.project_id, result.task_id)
     
     return {
         "success": True,
@@ -1420,7 +1959,7 @@ async def merge_videos_with_music(request: MergeVideosWithMusicRequest, backgrou
 
 
 @app.post("/api/creatomate/text-overlay")
-async def add_text_overlay(request: TextOverlayRequest, background_tasks: BackgroundTasks):
+async def add_text_overlay(request: TextOverlayRequest):
     """
     📝 비디오에 텍스트 오버레이 추가
     
@@ -1429,13 +1968,7 @@ async def add_text_overlay(request: TextOverlayRequest, background_tasks: Backgr
     - Creatomate API 사용
     """
     
-    ratio_map = {
-        "16:9": AspectRatio.LANDSCAPE,
-        "9:16": AspectRatio.PORTRAIT,
-        "1:1": AspectRatio.SQUARE,
-    }
-    
-    aspect_ratio = ratio_map.get(request.aspect_ratio, AspectRatio.PORTRAIT)
+    aspect_ratio = RATIO_MAP.get(request.aspect_ratio, AspectRatio.PORTRAIT)
     
     result = await factory.creatomate.add_text_overlay(
         project_id=request.project_id,
@@ -1448,17 +1981,18 @@ async def add_text_overlay(request: TextOverlayRequest, background_tasks: Backgr
         raise HTTPException(status_code=500, detail=f"텍스트 오버레이 실패: {result.message}")
     
     # Task 저장
-    task_store[f"text_{request.project_id}"] = {
+    await task_store.set(f"text_{request.project_id}", {
+        "task_type": "edit",
         "task_id": result.task_id,
         "model": "creatomate_text",
         "status": result.status,
         "progress": result.progress,
         "video_url": result.video_url,
         "created_at": datetime.utcnow().isoformat()
-    }
+    })
     
     if result.status != "completed":
-        background_tasks.add_task(poll_edit_status, request.project_id, result.task_id)
+        poller_pool.submit(poll_vendor_task, TEXT_SPEC, request.project_id, result.task_id)
     
     return {
         "success": True,
@@ -1472,24 +2006,24 @@ async def add_text_overlay(request: TextOverlayRequest, background_tasks: Backgr
     }
 
 
-@app.get("/api/creatomate/progress/{project_id}")
+@app.get("/api/creatomate/progress/{project_id}", response_class=ORJSONResponse)
 async def get_edit_progress(project_id: str):
     """편집 진행률 조회"""
     
     store_key = f"edit_{project_id}"
-    task_data = task_store.get(store_key)
+    task_data = await task_store.get(store_key)
     
     if not task_data:
         raise HTTPException(status_code=404, detail="편집 작업을 찾을 수 없습니다.")
     
-    return {
+    return ORJSONResponse({
         "success": True,
         "project_id": project_id,
         "render_id": task_data.get("task_id"),
         "status": task_data.get("status", "processing"),
         "progress": task_data.get("progress", 0),
         "video_url": task_data.get("video_url")
-    }
+    })
 
 
 # ============================================
@@ -1558,21 +2092,20 @@ async def export_txt(request: dict):
 async def create_project(request: ProjectCreateRequest):
     """새 프로젝트 생성"""
     
-    project_id = f"project_{int(datetime.utcnow().timestamp() * 1000)}"
-    
-    project = {
-        "id": project_id,
-        "user_id": request.user_id,
-        "title": request.title,
-        "description": request.description,
-        "aspect_ratio": request.aspect_ratio,
-        "preset": request.preset,
-        "model": request.model,
-        "status": "idle",
-        "video_url": None,
-        "created_at": datetime.utcnow().isoformat(),
-        "updated_at": datetime.utcnow().isoformat()
-    }
+    project_id = f"project_{time.time_ns()}_{next(_project_seq)}"
+    
+    now = datetime.utcnow().isoformat()
+    project = ProjectRecord(
+        id=project_id,
+        user_id=request.user_id,
+        title=request.title,
+        description=request.description,
+        aspect_ratio=request.aspect_ratio,
+        preset=request.preset,
+        model=request.model,
+        created_at=now,
+        updated_at=now
+    )
     
     project_store[project_id] = project
     
@@ -1584,7 +2117,7 @@ async def create_project(request: ProjectCreateRequest):
         preset=request.preset,
         model=request.model,
         status="idle",
-        created_at=project["created_at"]
+        created_at=project.created_at
     )
 
 
@@ -1595,7 +2128,7 @@ async def list_projects(user_id: Optional[str] = None):
     projects = list(project_store.values())
     
     if user_id:
-        projects = [p for p in projects if p.get("user_id") == user_id]
+        projects = [p for p in projects if p.user_id == user_id]
     
     return {
         "success": True,
@@ -1614,10 +2147,10 @@ async def get_project(project_id: str):
         raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
     
     # 영상 상태 병합
-    task_data = task_store.get(project_id, {})
-    project["video_status"] = task_data.get("status")
-    project["video_progress"] = task_data.get("progress")
-    project["video_url"] = task_data.get("video_url") or project.get("video_url")
+    task_data = await task_store.get(project_id) or {}
+    project.video_status = task_data.get("status")
+    project.video_progress = task_data.get("progress")
+    project.video_url = task_data.get("video_url") or project.video_url
     
     return {
         "success": True,
@@ -1634,7 +2167,7 @@ async def list_prompt_templates():
     """프롬프트 템플릿 목록"""
     return {
         "success": True,
-        "templates": list(prompt_templates_store.values())
+        "templates": await prompt_templates_store.values()
     }
 
 
@@ -1642,7 +2175,7 @@ async def list_prompt_templates():
 async def get_prompt_template(template_id: str):
     """프롬프트 템플릿 조회"""
     
-    template = prompt_templates_store.get(template_id)
+    template = await prompt_templates_store.get(template_id)
     
     if not template:
         raise HTTPException(status_code=404, detail="템플릿을 찾을 수 없습니다.")
@@ -1668,7 +2201,7 @@ async def create_prompt_template(request: PromptTemplateRequest):
         "updated_at": datetime.utcnow().isoformat()
     }
     
-    prompt_templates_store[request.id] = template
+    await prompt_templates_store.set(request.id, template)
     
     return {
         "success": True,
@@ -1681,7 +2214,7 @@ async def create_prompt_template(request: PromptTemplateRequest):
 async def update_prompt_template(template_id: str, request: PromptTemplateRequest):
     """프롬프트 템플릿 수정 (PUT)"""
     
-    if template_id not in prompt_templates_store:
+    if not await prompt_templates_store.contains(template_id):
         raise HTTPException(status_code=404, detail="템플릿을 찾을 수 없습니다.")
     
     # 기존 데이터 업데이트
@@ -1696,7 +2229,7 @@ async def update_prompt_template(template_id: str, request: PromptTemplateReques
         "updated_at": datetime.utcnow().isoformat()
     }
     
-    prompt_templates_store[template_id] = updated_template
+    await prompt_templates_store.set(template_id, updated_template)
     
     print(f"✅ [Admin] 템플릿 수정됨: {template_id}")
     
@@ -1711,11 +2244,9 @@ async def update_prompt_template(template_id: str, request: PromptTemplateReques
 async def delete_prompt_template(template_id: str):
     """프롬프트 템플릿 삭제"""
     
-    if template_id not in prompt_templates_store:
+    if not await prompt_templates_store.delete(template_id):
         raise HTTPException(status_code=404, detail="템플릿을 찾을 수 없습니다.")
     
-    del prompt_templates_store[template_id]
-    
     print(f"🗑️ [Admin] 템플릿 삭제됨: {template_id}")
     
     return {
@@ -1814,7 +2345,7 @@ Generate exactly {request.count} diverse templates now:"""
         
         print(f"🤖 [Gemini] 템플릿 자동 생성 요청: category={request.category}, count={request.count}")
         
-        response = model.generate_content(
+        response = await model.generate_content_async(
             system_prompt,
             generation_config=genai.types.GenerationConfig(
                 temperature=0.8,
@@ -1822,26 +2353,12 @@ Generate exactly {request.count} diverse templates now:"""
             )
         )
         
-        # 응답 파싱
-        response_text = response.text.strip()
-        
-        # JSON 추출 (마크다운 코드 블록 제거)
-        if response_text.startswith("```"):
-            # ```json ... ``` 형태 처리
-            lines = response_text.split("\n")
-            json_lines = []
-            in_json = False
-            for line in lines:
-                if line.startswith("```json") or line.startswith("```"):
-                    in_json = not in_json
-                    continue
-                if in_json or (not line.startswith("```")):
-                    json_lines.append(line)
-            response_text = "\n".join(json_lines).strip()
+        # 응답 파싱 - JSON 추출 (마크다운 코드 블록 제거)
+        response_text = strip_json_fence(response.text)
         
         # JSON 파싱
         try:
-            data = json.loads(response_text)
+            data = await loads_json(response_text)
             templates = data.get("templates", [])
         except json.JSONDecodeError as e:
             print(f"❌ [Gemini] JSON 파싱 실패: {e}")
@@ -1857,7 +2374,7 @@ Generate exactly {request.count} diverse templates now:"""
             template_id = template.get("id", f"{request.category}_{uuid.uuid4().hex[:8]}")
             
             # 중복 ID 방지
-            if template_id in prompt_templates_store:
+            if await prompt_templates_store.contains(template_id):
                 template_id = f"{template_id}_{uuid.uuid4().hex[:4]}"
             
             new_template = {
@@ -1874,7 +2391,7 @@ Generate exactly {request.count} diverse templates now:"""
                 "updated_at": datetime.utcnow().isoformat()
             }
             
-            prompt_templates_store[template_id] = new_template
+            await prompt_templates_store.set(template_id, new_template)
             saved_templates.append(new_template)
             print(f"✅ [Admin] AI 생성 템플릿 저장: {template_id}")
         
@@ -1921,66 +2438,71 @@ Generate exactly {request.count} diverse templates now:"""
 # Admin CMS - Vendor Management
 # ============================================
 
+# 기본 벤더 목록 - 환경 변수는 실행 중 바뀌지 않으므로 모듈 로드 시 1회 구성/직렬화
+DEFAULT_VENDORS: List[Dict[str, Any]] = [
+    {
+        "id": "goapi",
+        "name": "GoAPI (Universal)",
+        "api_endpoint": "https://api.goapi.ai/api/v1",
+        "api_key_env": "GOAPI_KEY",
+        "model_type": "video_generation",
+        "is_active": bool(os.getenv("GOAPI_KEY")),
+        "models": ["kling", "veo", "sora", "hailuo", "luma", "midjourney"]
+    },
+    {
+        "id": "kling_official",
+        "name": "Kling Official",
+        "api_endpoint": "https://api.klingai.com",
+        "api_key_env": "KLING_ACCESS_KEY",
+        "model_type": "video_generation",
+        "is_active": bool(os.getenv("KLING_ACCESS_KEY")),
+        "models": ["kling"]
+    },
+    {
+        "id": "heygen",
+        "name": "HeyGen",
+        "api_endpoint": "https://api.heygen.com",
+        "api_key_env": "HEYGEN_API_KEY",
+        "model_type": "avatar_generation",
+        "is_active": bool(os.getenv("HEYGEN_API_KEY")),
+        "models": ["heygen_avatar"]
+    },
+    {
+        "id": "creatomate",
+        "name": "Creatomate",
+        "api_endpoint": "https://api.creatomate.com/v1",
+        "api_key_env": "CREATOMATE_API_KEY",
+        "model_type": "video_editing",
+        "is_active": bool(os.getenv("CREATOMATE_API_KEY")),
+        "models": ["creatomate_editor"]
+    },
+    {
+        "id": "gemini",
+        "name": "Google Gemini",
+        "api_endpoint": "https://generativelanguage.googleapis.com",
+        "api_key_env": "GOOGLE_GEMINI_API_KEY",
+        "model_type": "ai_brain",
+        "is_active": bool(os.getenv("GOOGLE_GEMINI_API_KEY")),
+        "models": ["gemini-1.5-pro"]
+    }
+]
+
+# 기본 벤더 JSON 배열 본문 ("[" / "]" 제외) - 사용자 정의 벤더와 이어 붙여 응답
+_DEFAULT_VENDORS_JSON: bytes = orjson.dumps(DEFAULT_VENDORS)[1:-1]
+
+
 @app.get("/api/admin/vendors")
 async def list_vendors():
-    """벤더(API) 목록"""
+    """벤더(API) 목록 (기본 벤더 + 사용자 정의 벤더)"""
     
-    # 기본 벤더 목록
-    default_vendors = [
-        {
-            "id": "goapi",
-            "name": "GoAPI (Universal)",
-            "api_endpoint": "https://api.goapi.ai/api/v1",
-            "api_key_env": "GOAPI_KEY",
-            "model_type": "video_generation",
-            "is_active": bool(os.getenv("GOAPI_KEY")),
-            "models": ["kling", "veo", "sora", "hailuo", "luma", "midjourney"]
-        },
-        {
-            "id": "kling_official",
-            "name": "Kling Official",
-            "api_endpoint": "https://api.klingai.com",
-            "api_key_env": "KLING_ACCESS_KEY",
-            "model_type": "video_generation",
-            "is_active": bool(os.getenv("KLING_ACCESS_KEY")),
-            "models": ["kling"]
-        },
-        {
-            "id": "heygen",
-            "name": "HeyGen",
-            "api_endpoint": "https://api.heygen.com",
-            "api_key_env": "HEYGEN_API_KEY",
-            "model_type": "avatar_generation",
-            "is_active": bool(os.getenv("HEYGEN_API_KEY")),
-            "models": ["heygen_avatar"]
-        },
-        {
-            "id": "creatomate",
-            "name": "Creatomate",
-            "api_endpoint": "https://api.creatomate.com/v1",
-            "api_key_env": "CREATOMATE_API_KEY",
-            "model_type": "video_editing",
-            "is_active": bool(os.getenv("CREATOMATE_API_KEY")),
-            "models": ["creatomate_editor"]
-        },
-        {
-            "id": "gemini",
-            "name": "Google Gemini",
-            "api_endpoint": "https://generativelanguage.googleapis.com",
-            "api_key_env": "GOOGLE_GEMINI_API_KEY",
-            "model_type": "ai_brain",
-            "is_active": bool(os.getenv("GOOGLE_GEMINI_API_KEY")),
-            "models": ["gemini-1.5-pro"]
-        }
-    ]
+    body = b'{"success":true,"vendors":[' + _DEFAULT_VENDORS_JSON
     
     # 사용자 정의 벤더 추가
-    all_vendors = default_vendors + list(vendor_store.values())
+    custom_vendors = await vendor_store.values()
+    if custom_vendors:
+        body += b"," + orjson.dumps(custom_vendors)[1:-1]
     
-    return {
-        "success": True,
-        "vendors": all_vendors
-    }
+    return Response(content=body + b"]}", media_type="application/json")
 
 
 @app.post("/api/admin/vendors")
@@ -1997,7 +2519,7 @@ async def add_vendor(request: VendorRequest):
         "created_at": datetime.utcnow().isoformat()
     }
     
-    vendor_store[request.id] = vendor
+    await vendor_store.set(request.id, vendor)
     
     return {
         "success": True,
@@ -2010,11 +2532,9 @@ async def add_vendor(request: VendorRequest):
 async def delete_vendor(vendor_id: str):
     """벤더 삭제"""
     
-    if vendor_id not in vendor_store:
+    if not await vendor_store.delete(vendor_id):
         raise HTTPException(status_code=404, detail="벤더를 찾을 수 없습니다.")
     
-    del vendor_store[vendor_id]
-    
     return {
         "success": True,
         "message": "벤더가 삭제되었습니다."
@@ -2025,26 +2545,47 @@ async def delete_vendor(vendor_id: str):
 # Admin CMS - Trend Management
 # ============================================
 
+# 트렌드 응답 bytes 캐시 (워커별 5초, 이 워커의 업데이트 시 즉시 무효화)
+_trends_body_cache: TTLCache = TTLCache(maxsize=1, ttl=5)
+
+
 @app.get("/api/admin/trends")
-async def get_trends():
-    """트렌드 목록"""
-    return {
-        "success": True,
-        "trends": trend_store
-    }
+async def get_trends(request: Request):
+    """
+    트렌드 목록
+    - 직렬화된 응답을 캐시하고 내용 해시로 ETag 발급 (워커 간 동일)
+    - If-None-Match 일치 시 304
+    """
+    cached = _trends_body_cache.get("trends")
+    if cached is None:
+        body = orjson.dumps({
+            "success": True,
+            "trends": await trend_store.get()
+        })
+        etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        cached = _trends_body_cache["trends"] = (body, etag)
+    
+    body, etag = cached
+    # Admin 수정 직후 조회가 stale하지 않도록 매번 재검증 (변경 없으면 304로 본문 생략)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @app.post("/api/admin/trends")
 async def update_trends(request: TrendRequest):
     """트렌드 업데이트"""
-    global trend_store
     
-    trend_store = request.trends
+    await trend_store.replace(request.trends)
+    _trends_body_cache.clear()
     
     return {
         "success": True,
         "message": "트렌드가 업데이트되었습니다.",
-        "trends": trend_store
+        "trends": request.trends
     }
 
 
@@ -2052,35 +2593,32 @@ async def update_trends(request: TrendRequest):
 # Models & Presets Info
 # ============================================
 
+# 정적 응답 - 직렬화된 bytes를 그대로 반환 (모델 목록은 startup에서 API 키 확인 후 생성)
+_MODELS_JSON: bytes = orjson.dumps({"success": True, "models": []})
+_PRESETS_JSON: bytes = orjson.dumps({
+    "success": True,
+    "presets": [
+        {
+            "id": key,
+            "name": value["name"],
+            "color_grade": value.get("color_grade"),
+            "vignette": value.get("vignette")
+        }
+        for key, value in STYLE_PRESETS.items()
+    ]
+})
+
+
 @app.get("/api/models")
 async def list_models():
     """사용 가능한 모델 목록"""
-    
-    models = factory.get_available_models() if factory else []
-    
-    return {
-        "success": True,
-        "models": models
-    }
+    return Response(content=_MODELS_JSON, media_type="application/json")
 
 
 @app.get("/api/presets")
 async def list_presets():
     """스타일 프리셋 목록"""
-    
-    presets = []
-    for key, value in STYLE_PRESETS.items():
-        presets.append({
-            "id": key,
-            "name": value["name"],
-            "color_grade": value.get("color_grade"),
-            "vignette": value.get("vignette")
-        })
-    
-    return {
-        "success": True,
-        "presets": presets
-    }
+    return Response(content=_PRESETS_JSON, media_type="application/json")
 
 
 # ============================================
@@ -2091,16 +2629,7 @@ async def list_presets():
 async def optimize_prompt(prompt: str, tool: str = "kling"):
     """프롬프트 최적화"""
     
-    tool_map = {
-        "kling": ToolType.KLING,
-        "veo": ToolType.VEO,
-        "sora": ToolType.SORA,
-        "midjourney": ToolType.MIDJOURNEY,
-        "heygen": ToolType.HEYGEN,
-        "suno": ToolType.SUNO
-    }
-    
-    tool_type = tool_map.get(tool.lower(), ToolType.KLING)
+    tool_type = TOOL_MAP.get(tool.lower(), ToolType.KLING)
     optimized = await director.optimize_prompt_for_tool(prompt, tool_type)
     
     return {
@@ -2152,7 +2681,7 @@ class MusicGenerateRequest(BaseModel):
 
 
 @app.post("/api/music/generate")
-async def generate_music(request: MusicGenerateRequest, background_tasks: BackgroundTasks):
+async def generate_music(request: MusicGenerateRequest):
     """
     Suno AI 음악 생성 (via GoAPI)
     
@@ -2184,17 +2713,18 @@ async def generate_music(request: MusicGenerateRequest, background_tasks: Backgr
         )
     
     # Task 저장 (Fallback으로 Udio가 선택될 수 있음)
-    task_store[f"music_{request.project_id}"] = {
+    await task_store.set(f"music_{request.project_id}", {
+        "task_type": "music",
         "task_id": result.task_id,
         "model": result.model,  # suno 또는 udio
         "status": "processing",
         "progress": 10,
         "audio_url": None,
         "created_at": datetime.utcnow().isoformat()
-    }
+    })
     
     # 백그라운드 폴링
-    background_tasks.add_task(poll_music_status, request.project_id, result.task_id)
+    poller_pool.submit(poll_vendor_task, MUSIC_SPEC, request.project_id, result.task_id)
     
     return {
         "success": True,
@@ -2205,90 +2735,37 @@ async def generate_music(request: MusicGenerateRequest, background_tasks: Backgr
     }
 
 
-async def poll_music_status(project_id: str, task_id: str):
-    """Suno 음악 상태 폴링"""
-    max_attempts = 60  # 최대 5분
-    poll_interval = 5
-    
-    for attempt in range(max_attempts):
-        await asyncio.sleep(poll_interval)
-        
-        # GoAPI 상태 확인
-        url = f"https://api.goapi.ai/api/v1/task/{task_id}"
-        headers = {
-            "x-api-key": os.getenv("GOAPI_KEY")
-        }
-        
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, headers=headers)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    if data.get("code") == 200:
-                        task_data = data.get("data", {})
-                        status = task_data.get("status", "processing")
-                        output = task_data.get("output", {})
-                        
-                        store_key = f"music_{project_id}"
-                        if store_key in task_store:
-                            task_store[store_key]["status"] = status
-                            
-                            if status in ["completed", "succeed"]:
-                                # 오디오 URL 추출
-                                audio_url = output.get("audio_url") or output.get("url")
-                                task_store[store_key]["audio_url"] = audio_url
-                                task_store[store_key]["progress"] = 100
-                                print(f"✅ [MUSIC] 음악 생성 완료: {audio_url}")
-                                break
-                            elif status == "failed":
-                                task_store[store_key]["progress"] = 0
-                                print(f"❌ [MUSIC] 음악 생성 실패")
-                                break
-                            else:
-                                elapsed = (attempt + 1) * poll_interval
-                                task_store[store_key]["progress"] = min(90, 10 + attempt * 3)
-                                task_store[store_key]["message"] = f"생성 중... ({elapsed}초 경과)"
-                                
-        except Exception as e:
-            print(f"⚠️ [MUSIC] 폴링 오류: {e}")
-
-
-@app.get("/api/music/progress/{project_id}")
+@app.get("/api/music/progress/{project_id}", response_class=ORJSONResponse)
 async def get_music_progress(project_id: str):
     """음악 생성 진행률 조회"""
     
     store_key = f"music_{project_id}"
-    task_data = task_store.get(store_key)
+    task_data = await task_store.get(store_key)
     
     if not task_data:
         raise HTTPException(status_code=404, detail="음악 작업을 찾을 수 없습니다.")
     
-    return {
+    return ORJSONResponse({
         "success": True,
         "project_id": project_id,
         "task_id": task_data.get("task_id"),
         "status": task_data.get("status", "processing"),
         "progress": task_data.get("progress", 0),
         "audio_url": task_data.get("audio_url"),
-        "message": task_data.get("message", "처리 중...")
-    }
+        "message": _processing_message(task_data, "처리 중...")
+    })
 
 
 # ============================================
 # Hybrid Engine Status
 # ============================================
 
-@app.get("/api/engine/status")
-async def get_engine_status():
-    """
-    하이브리드 엔진 상태 조회
-    - 각 API 연결 상태
-    - 사용 가능한 모델 목록
-    """
-    
-    return {
+# 엔진 상태는 API 키/클라이언트 설정으로만 결정 → startup에서 1회 직렬화
+_ENGINE_STATUS_JSON: bytes = b""
+
+
+def _build_engine_status() -> bytes:
+    return orjson.dumps({
         "success": True,
         "engine": "Hybrid Factory Engine v5.0",
         "status": {
@@ -2333,7 +2810,17 @@ async def get_engine_status():
             "avatar": "HeyGen direct",
             "edit": "Creatomate direct"
         }
-    }
+    })
+
+
+@app.get("/api/engine/status")
+async def get_engine_status():
+    """
+    하이브리드 엔진 상태 조회
+    - 각 API 연결 상태
+    - 사용 가능한 모델 목록
+    """
+    return Response(content=_ENGINE_STATUS_JSON or _build_engine_status(), media_type="application/json")
 
 
 # ============================================
@@ -2342,4 +2829,12 @@ async def get_engine_status():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # 워커 수: WEB_CONCURRENCY (uvicorn CLI와 동일) - 2 이상이면 REDIS_URL 필요 (작업 상태 공유)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1"))
+    )
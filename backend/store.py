@@ -0,0 +1,476 @@
+"""
+Studio Juai PRO - Shared Stores
+===============================
+멀티 워커 환경에서 공유되는 저장소 (Redis)
+
+- REDIS_URL 설정 시: Redis Hash/List 사용 (uvicorn --workers N 간 일관성 보장)
+- REDIS_URL 미설정 시: 프로세스 내 dict 사용 (로컬 개발용)
+
+환경 변수:
+- REDIS_URL (예: redis://localhost:6379/0)
+"""
+
+import os
+import orjson
+import asyncio
+from typing import Optional, Dict, Any, List, Tuple
+
+from cachetools import TTLCache
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    print("⚠️ [Redis] redis 패키지 없음 - 인메모리 저장소 사용")
+
+
+# ============================================
+# Redis Client
+# ============================================
+
+_redis_instance = None
+
+def get_redis():
+    """Redis 클라이언트 싱글톤 (REDIS_URL 없으면 None → 인메모리 모드)"""
+    global _redis_instance
+    if _redis_instance is None and REDIS_AVAILABLE:
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url:
+            _redis_instance = aioredis.Redis.from_url(redis_url, decode_responses=True)
+            print("✅ [Redis] 클라이언트 초기화 완료")
+    return _redis_instance
+
+
+# ============================================
+# Hash Store (key → dict)
+# ============================================
+
+class HashStore:
+    """
+    Redis Hash 기반 key → dict 저장소
+
+    - Redis 키 하나(namespace)에 field별로 JSON 저장
+    - values()는 TTL 캐시 (Admin 목록 조회는 잦고 변경은 드묾)
+    - 같은 워커에서의 쓰기는 캐시를 즉시 무효화
+    """
+
+    def __init__(self, namespace: str, values_ttl: float = 5.0):
+        self.namespace = namespace
+        self._local: Dict[str, Dict[str, Any]] = {}
+        self._values_cache: TTLCache = TTLCache(maxsize=1, ttl=values_ttl)
+
+    @property
+    def redis(self):
+        return get_redis()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.redis is None:
+            return self._local.get(key)
+
+        raw = await self.redis.hget(self.namespace, key)
+        return orjson.loads(raw) if raw else None
+
+    async def contains(self, key: str) -> bool:
+        if self.redis is None:
+            return key in self._local
+        return bool(await self.redis.hexists(self.namespace, key))
+
+    async def set(self, key: str, value: Dict[str, Any]):
+        self._values_cache.clear()
+
+        if self.redis is None:
+            self._local[key] = value
+            return
+
+        await self.redis.hset(self.namespace, key, orjson.dumps(value).decode())
+
+    async def set_defaults(self, mapping: Dict[str, Dict[str, Any]]):
+        """없는 key만 저장 (워커 재시작 시 Admin 수정분을 덮어쓰지 않음)"""
+        self._values_cache.clear()
+
+        if self.redis is None:
+            for key, value in mapping.items():
+                self._local.setdefault(key, value)
+            return
+
+        pipe = self.redis.pipeline()
+        for key, value in mapping.items():
+            pipe.hsetnx(self.namespace, key, orjson.dumps(value).decode())
+        await pipe.execute()
+
+    async def delete(self, key: str) -> bool:
+        self._values_cache.clear()
+
+        if self.redis is None:
+            return self._local.pop(key, None) is not None
+        return bool(await self.redis.hdel(self.namespace, key))
+
+    async def values(self) -> List[Dict[str, Any]]:
+        cached = self._values_cache.get("values")
+        if cached is not None:
+            return cached
+
+        if self.redis is None:
+            values = list(self._local.values())
+        else:
+            values = [orjson.loads(raw) for raw in await self.redis.hvals(self.namespace)]
+
+        self._values_cache["values"] = values
+        return values
+
+
+# ============================================
+# List Store (전체 교체형 문자열 목록)
+# ============================================
+
+class ListStore:
+    """Redis List 기반 문자열 목록 (트렌드 키워드 등 전체 교체형 데이터)"""
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self._local: List[str] = []
+
+    @property
+    def redis(self):
+        return get_redis()
+
+    async def get(self) -> List[str]:
+        if self.redis is None:
+            return self._local
+        return await self.redis.lrange(self.namespace, 0, -1)
+
+    async def replace(self, items: List[str]):
+        if self.redis is None:
+            self._local = list(items)
+            return
+
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.delete(self.namespace)
+        if items:
+            pipe.rpush(self.namespace, *items)
+        await pipe.execute()
+
+
+# ============================================
+# Task Store (작업 상태)
+# ============================================
+
+# 있는 작업만 갱신 (만료/미생성 key에 부분 레코드를 만들지 않음) - HSET + EXPIRE + PUBLISH를 원자적으로
+# KEYS[1] = task:{key}, ARGV = ttl, 알림 채널, field1, value1, ...
+_UPDATE_IF_EXISTS_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[1], unpack(ARGV, 3))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+redis.call('PUBLISH', ARGV[2], '1')
+return 1
+"""
+
+
+class TaskStore:
+    """
+    작업 상태 저장소 (영상/이미지/음악/아바타/편집)
+
+    - Redis: 작업당 Hash 1개 (task:{key}), field 값은 JSON 인코딩
+    - 여러 작업 조회는 pipeline 1회 왕복으로 처리
+    - update()는 이미 있는 작업만 갱신 (만료 후 늦게 도착한 폴러 쓰기가 빈 레코드를 되살리지 않음)
+    - 벤더 task_id → key 역인덱스 (task_id:{task_id})로 전체 스캔 없이 조회
+    - 쓰기마다 변경 알림 발행 (Redis pub/sub: task_updates:{key}) → 롱폴링 대기
+    - 알림 대기는 asyncio.Condition 1개 + key별 버전 카운터
+      (대기자마다 Event/pubsub 연결을 만들지 않음 - notify_all 후 각자 자기 key 버전만 비교)
+    - Redis: 워커당 리스너 1개가 task_updates:* 를 구독하고 버전을 올림 (start()/stop())
+    - 인메모리: key → dict, 쓰기 시 바로 버전 증가
+      (Redis와 같은 TTL + 최대 개수 제한 - 오래 실행되는 서버에서 무한히 쌓이지 않음)
+
+    조회 → 대기 사이의 알림 유실 방지: 조회 전에 version(key)를 받아 두고 wait_for_update(since=...)에 전달
+    """
+
+    def __init__(self, namespace: str = "task", ttl: int = 3600, local_maxsize: int = 10_000):
+        self.namespace = namespace
+        self.ttl = ttl
+        self._local: TTLCache = TTLCache(maxsize=local_maxsize, ttl=ttl)
+        self._local_index: TTLCache = TTLCache(maxsize=local_maxsize, ttl=ttl)
+        self._local_versions: TTLCache = TTLCache(maxsize=local_maxsize, ttl=ttl)
+        self._local_cond = asyncio.Condition()
+        self._epoch = 0  # 리스너 재연결 횟수 - 끊긴 동안 유실된 알림이 있을 수 있으므로 전체 대기자 깨움
+        self._listener: Optional[asyncio.Task] = None
+        self._update_script = None
+
+    @property
+    def redis(self):
+        return get_redis()
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _index_key(self, task_id: str) -> str:
+        return f"{self.namespace}_id:{task_id}"
+
+    def _channel(self, key: str) -> str:
+        return f"{self.namespace}_updates:{key}"
+
+    async def start(self):
+        """Redis 변경 알림 리스너 시작 (구독 완료 후 반환, 인메모리 모드에서는 no-op)"""
+        if self.redis is None or self._listener is not None:
+            return
+
+        pubsub = await self._subscribe()
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen(pubsub))
+        else:
+            await pubsub.aclose()
+
+    async def stop(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+
+    async def _subscribe(self):
+        pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.psubscribe(self._channel("*"))
+        return pubsub
+
+    async def _listen(self, pubsub):
+        """task_updates:* 알림 → key 버전 증가 (연결이 끊기면 1초 후 재구독)"""
+        prefix_len = len(self._channel(""))
+        try:
+            while True:
+                try:
+                    if pubsub is None:
+                        pubsub = await self._subscribe()
+                        async with self._local_cond:
+                            self._epoch += 1
+                            self._local_cond.notify_all()
+
+                    async for message in pubsub.listen():
+                        await self._notify_local(message["channel"][prefix_len:])
+                except Exception as e:
+                    print(f"⚠️ [TaskStore] 변경 알림 구독 끊김 - 재연결: {e}")
+                    if pubsub is not None:
+                        try:
+                            await pubsub.aclose()
+                        except Exception:
+                            pass
+                    pubsub = None
+                    await asyncio.sleep(1)
+        finally:
+            if pubsub is not None:
+                await pubsub.aclose()
+
+    def version(self, key: str) -> Tuple[int, int]:
+        """변경 알림 버전 - 조회 전에 받아 두면 조회 이후의 변경을 wait_for_update가 놓치지 않음"""
+        return self._epoch, self._local_versions.get(key, 0)
+
+    async def _notify_local(self, *keys: str):
+        """key별 버전 증가 후 대기자 전체 깨움 (일괄 갱신도 notify 1회)"""
+        async with self._local_cond:
+            for key in keys:
+                self._local_versions[key] = self._local_versions.get(key, 0) + 1
+            self._local_cond.notify_all()
+
+    def _update_local(self, key: str, patch: Dict[str, Any]) -> bool:
+        """인메모리 갱신 - 다시 저장해 TTL 연장 (Redis update의 EXPIRE와 동일), 없는 key는 건너뜀"""
+        data = self._local.get(key)
+        if data is None:
+            return False
+        data.update(patch)
+        self._local[key] = data
+        return True
+
+    async def _queue_update(self, pipe, key: str, patch: Dict[str, Any]):
+        """pipeline에 조건부 갱신 스크립트 추가 (EVALSHA, 스크립트 미등록 시 redis-py가 로드)"""
+        if self._update_script is None:
+            self._update_script = self.redis.register_script(_UPDATE_IF_EXISTS_LUA)
+
+        args = [self.ttl, self._channel(key)]
+        for field, value in self._encode(patch).items():
+            args += [field, value]
+        await self._update_script(keys=[self._redis_key(key)], args=args, client=pipe)
+
+    @staticmethod
+    def _encode(data: Dict[str, Any]) -> Dict[str, str]:
+        return {k: orjson.dumps(v).decode() for k, v in data.items()}
+
+    @staticmethod
+    def _decode(raw: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        if not raw:
+            return None
+        return {k: orjson.loads(v) for k, v in raw.items()}
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.redis is None:
+            return self._local.get(key)
+        return self._decode(await self.redis.hgetall(self._redis_key(key)))
+
+    async def get_many(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """여러 작업을 한 번에 조회 (Redis: pipeline 1회 왕복)"""
+        if self.redis is None:
+            return [self._local.get(key) for key in keys]
+
+        pipe = self.redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.hgetall(self._redis_key(key))
+        return [self._decode(raw) for raw in await pipe.execute()]
+
+    async def set(self, key: str, data: Dict[str, Any]):
+        """작업 생성 (기존 상태는 교체)"""
+        task_id = data.get("task_id")
+
+        if self.redis is None:
+            self._local[key] = dict(data)
+            if task_id:
+                self._local_index[task_id] = key
+            await self._notify_local(key)
+            return
+
+        redis_key = self._redis_key(key)
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.delete(redis_key)
+        pipe.hset(redis_key, mapping=self._encode(data))
+        pipe.expire(redis_key, self.ttl)
+        if task_id:
+            pipe.set(self._index_key(task_id), key, ex=self.ttl)
+        pipe.publish(self._channel(key), "1")
+        await pipe.execute()
+
+    async def update(self, key: str, patch: Dict[str, Any]):
+        """작업 상태 일부 갱신 (폴러에서 사용)"""
+        if self.redis is None:
+            if self._update_local(key, patch):
+                await self._notify_local(key)
+            return
+
+        pipe = self.redis.pipeline(transaction=False)
+        await self._queue_update(pipe, key, patch)
+        await pipe.execute()
+
+    async def update_many(self, patches: Dict[str, Dict[str, Any]]):
+        """여러 작업 상태 일괄 갱신 (Redis: pipeline 1회 왕복)"""
+        if self.redis is None:
+            updated = [key for key, patch in patches.items() if self._update_local(key, patch)]
+            if updated:
+                await self._notify_local(*updated)
+            return
+
+        pipe = self.redis.pipeline(transaction=False)
+        for key, patch in patches.items():
+            await self._queue_update(pipe, key, patch)
+        await pipe.execute()
+
+    async def lookup(self, key_or_task_id: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """저장 key 또는 벤더 task_id로 작업 조회 (key/역인덱스를 한 번에 확인) → (key, data)"""
+        if self.redis is None:
+            data = self._local.get(key_or_task_id)
+            if data is not None:
+                return key_or_task_id, data
+            key = self._local_index.get(key_or_task_id)
+            return key, self._local.get(key) if key else None
+
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hgetall(self._redis_key(key_or_task_id))
+        pipe.get(self._index_key(key_or_task_id))
+        raw, key = await pipe.execute()
+
+        if raw:
+            return key_or_task_id, self._decode(raw)
+        return key, await self.get(key) if key else None
+
+    async def wait_for_update(self, key: str, timeout: float, since: Optional[Tuple[int, int]] = None) -> bool:
+        """
+        작업 변경 알림 대기 (롱폴링) - 변경 시 True, timeout 시 False
+
+        - since: 조회 전에 받아 둔 version(key) - 그 사이 이미 변경됐으면 바로 True
+        - 미지정 시 호출 시점 이후의 변경만 대기
+        """
+        await self.start()
+
+        async with self._local_cond:
+            if since is None:
+                since = self.version(key)
+            try:
+                await asyncio.wait_for(
+                    self._local_cond.wait_for(lambda: self.version(key) != since),
+                    timeout
+                )
+                return True
+            except asyncio.TimeoutError:
+                return False
+
+
+# ============================================
+# Task Write Queue (폴러 → task_store 비동기 쓰기)
+# ============================================
+
+class TaskWriteQueue:
+    """
+    task_store 쓰기 큐
+
+    - 폴러는 put()만 하고 바로 다음 tick으로 진행 (저장 I/O를 기다리지 않음)
+    - key 해시로 shard를 나누고 shard마다 writer 코루틴 1개
+      (한 shard의 Redis 왕복이 느려도 다른 shard 저장은 계속 진행, 같은 key는 항상 같은 shard → 순서 보장)
+    - writer는 큐에 쌓인 patch를 key별로 합쳐 update_many 1회로 저장
+    - 큐가 가득 차면 put()이 대기 (backpressure)
+    """
+
+    def __init__(self, store: TaskStore, maxsize: int = 1024, shards: int = 4):
+        self.store = store
+        self.queues: List[asyncio.Queue] = [asyncio.Queue(maxsize) for _ in range(shards)]
+        self._writers: List[asyncio.Task] = []
+
+    def start(self):
+        if not self._writers:
+            self._writers = [asyncio.create_task(self._run(queue)) for queue in self.queues]
+
+    async def stop(self):
+        """
+        writer 종료 - shard마다 종료 신호(None)를 넣고 남은 patch 저장이 끝날 때까지 대기
+        (취소하지 않음 - 저장 중이던 patch가 유실되지 않도록)
+        """
+        if not self._writers:
+            pending: Dict[str, Dict[str, Any]] = {}
+            for queue in self.queues:
+                self._drain(queue, pending)
+            await self._flush(pending)
+            return
+
+        for queue in self.queues:
+            await queue.put(None)
+        await asyncio.gather(*self._writers, return_exceptions=True)
+        self._writers = []
+
+    async def put(self, key: str, patch: Dict[str, Any]):
+        await self.queues[hash(key) % len(self.queues)].put((key, patch))
+
+    @staticmethod
+    def _drain(queue: asyncio.Queue, pending: Dict[str, Dict[str, Any]]) -> bool:
+        """큐에 쌓인 patch를 key별로 합침 - 종료 신호를 만나면 True"""
+        while not queue.empty():
+            item = queue.get_nowait()
+            if item is None:
+                return True
+            key, patch = item
+            pending.setdefault(key, {}).update(patch)
+        return False
+
+    async def _flush(self, pending: Dict[str, Dict[str, Any]]):
+        if not pending:
+            return
+        try:
+            await self.store.update_many(pending)
+        except Exception as e:
+            print(f"⚠️ [TaskWriteQueue] 저장 실패 ({len(pending)}건): {e}")
+
+    async def _run(self, queue: asyncio.Queue):
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            key, patch = item
+            pending = {key: dict(patch)}
+            stopping = self._drain(queue, pending)
+            await self._flush(pending)
+            if stopping:
+                return